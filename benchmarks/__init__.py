@@ -0,0 +1 @@
+"""Benchmarks for zwave-js-server-python."""
@@ -0,0 +1,48 @@
+"""Run the benchmark suite for synthetic networks of increasing size.
+
+Run with `python -m benchmarks`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from . import bench_commands, bench_driver, bench_events
+
+DEFAULT_NODE_COUNTS = (10, 100, 1000)
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--nodes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_NODE_COUNTS,
+        help="Numbers of nodes of the synthetic networks",
+    )
+    parser.add_argument(
+        "--events", type=int, default=10000, help="Number of events per run"
+    )
+    parser.add_argument(
+        "--commands", type=int, default=5000, help="Number of commands per run"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    for node_count in args.nodes:
+        print(f"# {node_count} nodes")
+        asyncio.run(bench_driver.run(node_count, args.repeat))
+        asyncio.run(bench_events.run(node_count, args.events, args.repeat))
+        print()
+
+    print("# command round trips")
+    bench_commands.run(args.commands, 1, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark the command round trip through the client against the mock server.
+
+Run with `python -m benchmarks.bench_commands`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict, deque
+import logging
+import time
+
+from aiohttp import ClientSession, web
+
+from scripts.run_mock_server import MockZwaveJsServer, command_fingerprint
+from zwave_js_server.client import Client
+from zwave_js_server.const import MAX_SERVER_SCHEMA_VERSION
+from zwave_js_server.util.message_id import MessageIdGenerator, uuid_message_id
+
+from .common import make_network_state, measure, print_rate, print_result
+
+COMMAND = {"command": "node.ping", "nodeId": 2}
+
+MESSAGE_ID_FACTORIES = {
+    "counter": None,
+    "uuid": uuid_message_id,
+}
+
+
+def make_server_dump(node_count: int) -> list[dict]:
+    """Return the network state dump of the mock server."""
+    return [
+        {
+            "type": "version",
+            "driverVersion": "bench_driver_version",
+            "serverVersion": "bench_server_version",
+            "homeId": 1234,
+            "minSchemaVersion": 0,
+            "maxSchemaVersion": MAX_SERVER_SCHEMA_VERSION,
+        },
+        {"type": "result", "success": True, "result": {}, "messageId": "initialize"},
+        {
+            "type": "result",
+            "success": True,
+            "result": {"state": make_network_state(node_count)},
+            "messageId": "start-listening",
+        },
+    ]
+
+
+async def run_round_trips(
+    command_count: int, concurrency: int, message_ids: str
+) -> None:
+    """Send commands to the mock server and print the command rate."""
+    command_results: defaultdict = defaultdict(deque)
+    command_results[command_fingerprint(COMMAND)] = deque(
+        [{"type": "result", "success": True, "result": {"responded": True}}]
+        * command_count
+    )
+    server = MockZwaveJsServer(make_server_dump(1), [], command_results)
+    runner = web.AppRunner(server.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    async with ClientSession() as session:
+        client = Client(
+            f"ws://127.0.0.1:{port}",
+            session,
+            message_id_factory=MESSAGE_ID_FACTORIES[message_ids],
+        )
+        await client.connect()
+        driver_ready = asyncio.Event()
+        listen_task = asyncio.create_task(client.listen(driver_ready))
+        await driver_ready.wait()
+
+        async def send_commands(count: int) -> None:
+            for _ in range(count):
+                await client.async_send_command(dict(COMMAND))
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(send_commands(command_count // concurrency) for _ in range(concurrency))
+        )
+        seconds = time.perf_counter() - start
+
+        await client.disconnect()
+        await listen_task
+
+    await runner.cleanup()
+    print_rate(
+        f"round trips ({message_ids} IDs, {concurrency} concurrent)",
+        command_count,
+        seconds,
+        "commands",
+    )
+
+
+def run(command_count: int, concurrency: int, repeat: int) -> None:
+    """Run the benchmark."""
+    generator = MessageIdGenerator()
+    print_result(
+        "counter message ID", measure(generator, number=10000, repeat=repeat), "us"
+    )
+    print_result(
+        "uuid message ID",
+        measure(uuid_message_id, number=10000, repeat=repeat),
+        "us",
+    )
+    for message_ids in MESSAGE_ID_FACTORIES:
+        for _ in range(repeat):
+            asyncio.run(run_round_trips(command_count, concurrency, message_ids))
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--commands", type=int, default=5000, help="Number of commands per run"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Number of concurrent senders"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    run(args.commands, args.concurrency, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
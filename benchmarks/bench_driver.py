@@ -0,0 +1,66 @@
+"""Benchmark Driver construction from a network state dump.
+
+Run with `python -m benchmarks.bench_driver`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import tracemalloc
+
+import aiohttp
+
+from zwave_js_server.client import Client
+from zwave_js_server.model.driver import Driver
+
+from .common import LOG_CONFIG, make_network_state, measure, print_result
+
+
+async def run(node_count: int, repeat: int) -> None:
+    """Run the benchmark."""
+    state_str = json.dumps(make_network_state(node_count))
+
+    async with aiohttp.ClientSession() as session:
+        client = Client("ws://localhost:3000", session)
+
+        for copy_data in (True, False):
+            seconds = measure(
+                lambda state, copy_data=copy_data: Driver(
+                    client, state, LOG_CONFIG, copy_data=copy_data
+                ),
+                repeat=repeat,
+                # A freshly parsed state, like the client receives it
+                setup=lambda: json.loads(state_str),
+            )
+            print_result(f"Driver({node_count} nodes, copy_data={copy_data})", seconds)
+
+        # Memory of building a driver from the raw state dump like the client does
+        gc.collect()
+        tracemalloc.start()
+        state = json.loads(state_str)
+        driver = Driver(client, state, LOG_CONFIG, copy_data=False)
+        del state
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{'peak memory (parse + Driver)':<50} {peak / 1e6:>12.1f} MB")
+        print(f"{'retained memory (Driver)':<50} {retained / 1e6:>12.1f} MB")
+        per_node = retained / node_count
+        print(f"{'retained memory per node':<50} {per_node / 1e3:>12.1f} kB")
+        del driver
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=232, help="Number of nodes")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+    asyncio.run(run(args.nodes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark Node construction and updates for a node with many endpoints.
+
+Run with `python -m benchmarks.bench_endpoints`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+import aiohttp
+
+from zwave_js_server.client import Client
+from zwave_js_server.model.node import Node
+
+from .common import make_multi_endpoint_node_state, measure, print_result
+
+
+async def run(endpoint_count: int, repeat: int) -> None:
+    """Run the benchmark."""
+    state_str = json.dumps(make_multi_endpoint_node_state(endpoint_count))
+    value_count = len(json.loads(state_str)["values"])
+    name = f"{endpoint_count} endpoints, {value_count} values"
+
+    async with aiohttp.ClientSession() as session:
+        client = Client("ws://localhost:3000", session)
+
+        seconds = measure(
+            lambda state: Node(client, state, copy_data=False),
+            number=100,
+            repeat=repeat,
+            setup=lambda: json.loads(state_str),
+        )
+        print_result(f"Node({name})", seconds, "us")
+
+        node = Node(client, json.loads(state_str), copy_data=False)
+        seconds = measure(
+            lambda state: node.update(state, copy_data=False),
+            number=100,
+            repeat=repeat,
+            setup=lambda: json.loads(state_str),
+        )
+        print_result(f"Node.update({name})", seconds, "us")
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoints", type=int, default=12, help="Number of endpoints")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+    asyncio.run(run(args.endpoints, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark event throughput through Client and Driver.receive_event.
+
+Run with `python -m benchmarks.bench_events`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import aiohttp
+
+from zwave_js_server.client import Client
+from zwave_js_server.event import Event, EventValidationMode
+from zwave_js_server.model.driver import Driver
+
+from .common import LOG_CONFIG, make_network_state, print_rate
+
+
+def make_value_updated_events(driver: Driver, count: int) -> list[Event]:
+    """Return value updated events for the values of the nodes of the driver."""
+    values = [
+        value
+        for node in driver.controller.nodes.values()
+        for value in node.values.values()
+    ]
+    events = []
+    for idx in range(count):
+        value = values[idx % len(values)]
+        args = {
+            "commandClassName": value.command_class_name,
+            "commandClass": value.command_class,
+            "property": value.property_,
+            "propertyName": value.property_name,
+            "newValue": idx,
+            "prevValue": value.value,
+        }
+        if value.endpoint is not None:
+            args["endpoint"] = value.endpoint
+        if value.property_key is not None:
+            args["propertyKey"] = value.property_key
+        events.append(
+            Event(
+                "value updated",
+                {
+                    "source": "node",
+                    "event": "value updated",
+                    "nodeId": value.node.node_id,
+                    "args": args,
+                },
+            )
+        )
+    return events
+
+
+async def run(node_count: int, event_count: int, repeat: int) -> None:
+    """Run the benchmark."""
+    state_str = json.dumps(make_network_state(node_count))
+
+    async with aiohttp.ClientSession() as session:
+        for mode in EventValidationMode:
+            client = Client("ws://localhost:3000", session, event_validation=mode)
+            driver = client.driver = Driver(
+                client, json.loads(state_str), LOG_CONFIG, copy_data=False
+            )
+            events_str = json.dumps(
+                [event.data for event in make_value_updated_events(driver, event_count)]
+            )
+
+            best = float("inf")
+            for _ in range(repeat):
+                # Handlers modify the event data, so use fresh events for each run
+                events = [Event(data["event"], data) for data in json.loads(events_str)]
+                start = time.perf_counter()
+                for event in events:
+                    driver.receive_event(event)
+                best = min(best, time.perf_counter() - start)
+
+            print_rate(f"Driver.receive_event({mode} validation)", event_count, best)
+
+        # The full path of a parsed message through the client
+        client = Client("ws://localhost:3000", session)
+        driver = client.driver = Driver(
+            client, json.loads(state_str), LOG_CONFIG, copy_data=False
+        )
+        messages_str = json.dumps(
+            [
+                {"type": "event", "event": event.data}
+                for event in make_value_updated_events(driver, event_count)
+            ]
+        )
+        best = float("inf")
+        for _ in range(repeat):
+            messages = json.loads(messages_str)
+            start = time.perf_counter()
+            for message in messages:
+                # pylint: disable-next=protected-access
+                client._handle_incoming_message(message)
+            best = min(best, time.perf_counter() - start)
+        print_rate(
+            f"Client._handle_incoming_message({node_count} nodes)", event_count, best
+        )
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=50, help="Number of nodes")
+    parser.add_argument(
+        "--events", type=int, default=10000, help="Number of events per run"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+    asyncio.run(run(args.nodes, args.events, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
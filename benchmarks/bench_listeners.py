@@ -0,0 +1,60 @@
+"""Benchmark event listener registration and emission on EventBase.
+
+Run with `python -m benchmarks.bench_listeners`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from functools import partial
+
+from zwave_js_server.event import EventBase
+
+from .common import measure, print_result
+
+
+def noop(data: dict) -> None:
+    """Do nothing."""
+
+
+def run(listener_count: int, repeat: int) -> None:
+    """Run the benchmark."""
+    event_base = EventBase()
+    for _ in range(listener_count):
+        event_base.on("value updated", noop)
+    seconds = measure(
+        lambda: event_base.emit("value updated", {}), number=100, repeat=repeat
+    )
+    print_result(f"EventBase.emit({listener_count} listeners)", seconds, "us")
+
+    def subscribe_all() -> list:
+        event_base = EventBase()
+        return [
+            event_base.on("value updated", partial(noop)) for _ in range(listener_count)
+        ]
+
+    def unsubscribe_all(unsubs: list) -> None:
+        # Unsubscribe the most recently added listeners first, like entities that
+        # are removed in reverse order of their setup
+        for unsub in reversed(unsubs):
+            unsub()
+
+    seconds = measure(subscribe_all, repeat=repeat)
+    print_result(f"EventBase.on({listener_count} listeners)", seconds)
+    seconds = measure(unsubscribe_all, repeat=repeat, setup=subscribe_all)
+    print_result(f"unsubscribe({listener_count} listeners)", seconds)
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--listeners", type=int, default=5000, help="Number of listeners"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+    run(args.listeners, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark the memory and construction time of Value objects.
+
+Run with `python -m benchmarks.bench_values`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, cast
+
+from zwave_js_server.const import CommandClass
+from zwave_js_server.model.node import Node
+from zwave_js_server.model.value import ConfigurationValue, MetadataPool, Value
+
+from .common import DEFAULT_NODE_FIXTURES, load_fixture, measure, print_result
+
+
+def make_values(
+    node: Node,
+    values_data: list[dict[str, Any]],
+    metadata_pool: MetadataPool | None = None,
+) -> list[Value]:
+    """Return values built from value data like a node builds them."""
+    return [
+        (
+            ConfigurationValue(node, cast(Any, val), metadata_pool)
+            if val["commandClass"] == CommandClass.CONFIGURATION
+            else Value(node, cast(Any, val), metadata_pool)
+        )
+        for val in values_data
+    ]
+
+
+def run(value_count: int, repeat: int) -> None:
+    """Run the benchmark."""
+    fixture_values = [
+        val for name in DEFAULT_NODE_FIXTURES for val in load_fixture(name)["values"]
+    ]
+    values_data = [
+        fixture_values[idx % len(fixture_values)] for idx in range(value_count)
+    ]
+    # Values only use their node to compute their ID, which isn't done here
+    node = cast(Node, None)
+
+    values_str = json.dumps(values_data)
+    for pooled in (False, True):
+        seconds = measure(
+            lambda pooled=pooled: make_values(
+                node, values_data, MetadataPool() if pooled else None
+            ),
+            repeat=repeat,
+        )
+        print_result(f"Value({value_count} values, pooled={pooled})", seconds)
+
+        # Parse the value data while tracing and release it once the values are
+        # built, like the client does with the state dump
+        gc.collect()
+        tracemalloc.start()
+        metadata_pool = MetadataPool() if pooled else None
+        parsed_data = json.loads(values_str)
+        values = make_values(node, parsed_data, metadata_pool)
+        del parsed_data
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{f'retained memory per value (pooled={pooled})':<50} "
+            f"{retained / len(values):>12.0f} B"
+        )
+        del values
+
+
+def main() -> None:
+    """Run main entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=30000, help="Number of values")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+    run(args.values, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
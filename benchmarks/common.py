@@ -0,0 +1,120 @@
+"""Common helpers for benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import copy
+import json
+import pathlib
+import time
+from typing import Any
+
+FIXTURES_PATH = pathlib.Path(__file__).parent.parent / "test" / "fixtures"
+
+DEFAULT_NODE_FIXTURES = (
+    "multisensor_6_state.json",
+    "lock_schlage_be469_state.json",
+    "climate_radio_thermostat_ct100_plus_state.json",
+    "switch_enbrighten_zw3010_state.json",
+)
+
+LOG_CONFIG = {
+    "enabled": True,
+    "level": "info",
+    "logToFile": False,
+    "filename": "",
+    "forceConsole": False,
+}
+
+
+def load_fixture(name: str) -> Any:
+    """Load a JSON fixture from the test fixtures."""
+    return json.loads((FIXTURES_PATH / name).read_text())
+
+
+def clone_node_state(node_state: dict, node_id: int) -> dict:
+    """Return a copy of a node state dump with a new node ID."""
+    node_state = copy.deepcopy(node_state)
+    node_state["nodeId"] = node_id
+    for endpoint in node_state["endpoints"]:
+        endpoint["nodeId"] = node_id
+    for value in node_state["values"]:
+        if "nodeId" in value:
+            value["nodeId"] = node_id
+    return node_state
+
+
+def make_network_state(
+    node_count: int, node_fixtures: Sequence[str] = DEFAULT_NODE_FIXTURES
+) -> dict:
+    """Return a synthetic network state with node_count nodes.
+
+    Nodes are cloned round robin from the given node state fixtures.
+    """
+    state = load_fixture("controller_state.json")
+    node_states = [load_fixture(name) for name in node_fixtures]
+    state["nodes"] = [
+        clone_node_state(node_states[idx % len(node_states)], idx + 2)
+        for idx in range(node_count)
+    ]
+    return state
+
+
+def measure(
+    func: Callable[..., Any],
+    number: int = 1,
+    repeat: int = 5,
+    setup: Callable[[], Any] | None = None,
+) -> float:
+    """Return the best time in seconds of a single call to func.
+
+    If setup is given, it is called before each repeat (outside of the timing) and
+    its return value is passed to func.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        args = [setup() for _ in range(number)] if setup else [None] * number
+        start = time.perf_counter()
+        for arg in args:
+            if setup:
+                func(arg)
+            else:
+                func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def print_result(name: str, seconds: float, unit: str = "ms") -> None:
+    """Print a benchmark result."""
+    factor = {"s": 1, "ms": 1e3, "us": 1e6}[unit]
+    print(f"{name:<50} {seconds * factor:>12.3f} {unit}")
+
+
+def make_multi_endpoint_node_state(
+    endpoint_count: int, node_fixture: str = "invalid_multilevel_sensor_type_state.json"
+) -> dict:
+    """Return a synthetic node state with endpoint_count endpoints besides the root.
+
+    Endpoint 1 of the node state fixture and its values are cloned onto endpoints
+    1 to endpoint_count.
+    """
+    node_state = load_fixture(node_fixture)
+    root_endpoint = next(ep for ep in node_state["endpoints"] if ep["index"] == 0)
+    template_endpoint = next(ep for ep in node_state["endpoints"] if ep["index"] == 1)
+    root_values = [val for val in node_state["values"] if not val.get("endpoint")]
+    template_values = [val for val in node_state["values"] if val.get("endpoint") == 1]
+    node_state["endpoints"] = [root_endpoint]
+    node_state["values"] = root_values
+    for index in range(1, endpoint_count + 1):
+        node_state["endpoints"].append(
+            {**copy.deepcopy(template_endpoint), "index": index}
+        )
+        node_state["values"].extend(
+            {**copy.deepcopy(val), "endpoint": index} for val in template_values
+        )
+    return node_state
+
+
+def print_rate(name: str, count: int, seconds: float, unit: str = "events") -> None:
+    """Print a benchmark result as a rate."""
+    print(f"{name:<50} {count / seconds:>12.0f} {unit}/s")
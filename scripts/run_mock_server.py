@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from collections import defaultdict
-from collections.abc import Hashable
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+import copy
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
 import json
 import logging
+import time
 from typing import Any
 
 from aiohttp import WSMsgType, web, web_request
@@ -15,6 +20,8 @@ from aiohttp import WSMsgType, web, web_request
 from zwave_js_server.client import SIZE_PARSE_JSON_EXECUTOR
 from zwave_js_server.const import MAX_SERVER_SCHEMA_VERSION, MIN_SERVER_SCHEMA_VERSION
 from zwave_js_server.model.version import VersionInfoDataType
+from zwave_js_server.util.journal import read_journal
+from zwave_js_server.util.json import DEFAULT_CODEC, orjson
 
 DATEFMT = "%Y-%m-%d %H:%M:%S"
 FMT = "%(asctime)s [%(levelname)s] %(message)s"
@@ -41,22 +48,122 @@ class ExitException(Exception):
     """Represent an exit error."""
 
 
-# https://stackoverflow.com/a/1151686
-class HashableDict(dict):
-    """Dictionary that can be used as a key in a dictionary."""
+def canonical_dumps(obj: Any) -> bytes | str:
+    """Encode an object to JSON with sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
 
-    def __key(self) -> tuple:
-        """Return key representation of HashableDict."""
-        return tuple((k, self[k]) for k in sorted(self))
 
-    def __hash__(self) -> int:  # type: ignore
-        """Return hash representation of HashableDict."""
-        return hash(self.__key())
+@dataclass
+class ReplayOptions:
+    """Represent the options of the event replay."""
 
-    def __eq__(self, other: Any) -> bool:
-        """Return whether HashableDict is equal to other."""
-        # pylint: disable=protected-access
-        return isinstance(other, HashableDict) and self.__key() == other.__key()
+    # Factor that the recorded event timing is sped up by. Events are replayed as
+    # fast as possible when neither speed nor rate is set.
+    speed: float | None = None
+    # Target rate in events per second
+    rate: float | None = None
+    # Number of times the events are replayed, 0 to replay them until disconnected
+    loops: int = 1
+    # Seconds to wait after the client started listening before replaying
+    delay: float = 1.0
+
+
+@dataclass
+class ReplayStats:
+    """Represent the result of an event replay."""
+
+    event_count: int
+    seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        """Return the number of events per second the client consumed."""
+        return self.event_count / self.seconds if self.seconds else 0.0
+
+
+class EventReplayer:
+    """
+    Class to replay events to a client.
+
+    Events are encoded once up front, so the encoding isn't part of the replay time.
+    The replay ends with a websocket ping that the client only answers after it
+    handled all events before it, so the reported rate is the rate that the client
+    consumed events at rather than the rate they were written to the socket.
+    """
+
+    def __init__(
+        self,
+        events_to_replay: list[dict],
+        options: ReplayOptions,
+    ) -> None:
+        """Initialize class."""
+        if options.speed is not None and options.rate is not None:
+            raise ExitException("Replay speed and rate can't both be set")
+        self.options = options
+        self._frames = [
+            DEFAULT_CODEC.dumps(record["event_msg"]) for record in events_to_replay
+        ]
+        self._offsets = self._get_offsets(events_to_replay)
+
+    def _get_offsets(self, events_to_replay: list[dict]) -> list[float] | None:
+        """Return the offset in seconds of each event from the start of a loop."""
+        if self.options.rate is not None:
+            return [idx / self.options.rate for idx in range(len(events_to_replay))]
+        if self.options.speed is None:
+            return None
+        if any("ts" not in record for record in events_to_replay):
+            raise ExitException("Time scaled replay requires a ts for every event")
+        timestamps = [
+            datetime.fromisoformat(record["ts"]).timestamp()
+            for record in events_to_replay
+        ]
+        return [(ts - timestamps[0]) / self.options.speed for ts in timestamps]
+
+    def _get_loop_duration(self) -> float:
+        """Return the duration in seconds of a loop."""
+        if not self._offsets:
+            return 0.0
+        if self.options.rate is not None:
+            return len(self._offsets) / self.options.rate
+        return self._offsets[-1]
+
+    async def async_replay(
+        self,
+        send_str: Callable[[str], Awaitable[None]],
+        wait_consumed: Callable[[], Awaitable[None]],
+        report: Callable[[ReplayStats], None],
+    ) -> None:
+        """Replay the events.
+
+        The stats are reported after the replay, or after every loop when the events
+        are replayed until disconnected.
+        """
+        await asyncio.sleep(self.options.delay)
+        if not self._frames:
+            return
+
+        loop_duration = self._get_loop_duration()
+        event_count = 0
+        loop_idx = 0
+        start = time.perf_counter()
+        while not self.options.loops or loop_idx < self.options.loops:
+            loop_start = start + loop_idx * loop_duration
+            for idx, frame in enumerate(self._frames):
+                if self._offsets is not None:
+                    delay = loop_start + self._offsets[idx] - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await send_str(frame)
+            event_count += len(self._frames)
+            loop_idx += 1
+            if not self.options.loops:
+                await wait_consumed()
+                report(ReplayStats(event_count, time.perf_counter() - start))
+        if self.options.loops:
+            await wait_consumed()
+            report(ReplayStats(event_count, time.perf_counter() - start))
 
 
 class MockZwaveJsServer:
@@ -70,7 +177,8 @@ class MockZwaveJsServer:
         self,
         network_state_dump: list[dict],
         events_to_replay: list[dict],
-        command_results: defaultdict[HashableDict, list],
+        command_results: defaultdict[bytes | str, deque],
+        replay_options: ReplayOptions | None = None,
     ) -> None:
         """Initialize class."""
         self.network_state_dump = network_state_dump
@@ -82,14 +190,19 @@ class MockZwaveJsServer:
             ]
         )
         self.primary_ws_resp: web.WebSocketResponse | None = None
-        self.events_to_replay = events_to_replay
+        self.replayer = EventReplayer(
+            events_to_replay, replay_options or ReplayOptions()
+        )
         self.command_results = command_results
+        self.replay_stats: list[ReplayStats] = []
+        self._replay_task: asyncio.Task | None = None
+        self._pong_waiter: asyncio.Future[None] | None = None
 
     async def send_json(self, data: dict) -> None:
         """Send JSON."""
         logging.debug("Sending JSON: %s", data)
         assert self.primary_ws_resp is not None
-        await self.primary_ws_resp.send_json(data)
+        await self.primary_ws_resp.send_json(data, dumps=DEFAULT_CODEC.dumps)
 
     async def send_command_result(
         self,
@@ -109,6 +222,32 @@ class MockZwaveJsServer:
             {"result": result, "type": "result", "success": True}, message_id
         )
 
+    async def async_replay_events(self, ws_resp: web.WebSocketResponse) -> None:
+        """Replay the events to the client and log the rate they were consumed at."""
+
+        async def wait_consumed() -> None:
+            """Wait until the client handled all events sent before."""
+            self._pong_waiter = asyncio.get_running_loop().create_future()
+            await ws_resp.ping(b"replay")
+            await self._pong_waiter
+
+        def report(stats: ReplayStats) -> None:
+            """Log the replay stats."""
+            self.replay_stats.append(stats)
+            logging.info(
+                "Replayed %s events in %.3f s, the client consumed %.0f events/s",
+                stats.event_count,
+                stats.seconds,
+                stats.events_per_second,
+            )
+
+        try:
+            await self.replayer.async_replay(ws_resp.send_str, wait_consumed, report)
+        except ConnectionResetError:
+            logging.info("Client disconnected during the event replay")
+        finally:
+            self._pong_waiter = None
+
     async def process_record(self, record: dict) -> None:
         """Process a replay dump record."""
         if record.get("record_type") not in ("event", "command"):
@@ -122,7 +261,8 @@ class MockZwaveJsServer:
         self, request: web_request.Request
     ) -> web.WebSocketResponse:
         """Handle websocket requests to the server."""
-        ws_resp = web.WebSocketResponse(autoclose=False)
+        # Pings and pongs are handled below to measure the event replay
+        ws_resp = web.WebSocketResponse(autoclose=False, autoping=False)
         self.primary_ws_resp = ws_resp
         await ws_resp.prepare(request)
 
@@ -147,10 +287,10 @@ class MockZwaveJsServer:
                 try:
                     if len(msg.data) > SIZE_PARSE_JSON_EXECUTOR:
                         data: dict = await asyncio.get_event_loop().run_in_executor(
-                            None, msg.json
+                            None, partial(msg.json, loads=DEFAULT_CODEC.loads)
                         )
                     else:
-                        data = msg.json()
+                        data = msg.json(loads=DEFAULT_CODEC.loads)
                 except ValueError as err:
                     raise ExitException(f"Received invalid JSON {msg.data}") from err
 
@@ -177,19 +317,30 @@ class MockZwaveJsServer:
                     )
                 elif cmd == "start_listening":
                     await self.send_json(self.network_state_dump[2])
-                    await asyncio.sleep(1)
-                    for event in self.events_to_replay:
-                        await self.send_json(event)
-                elif resp_list := self.command_results[sanitize_msg(data)]:
-                    await self.send_command_result(resp_list.pop(0), message_id)
+                    if self._replay_task:
+                        self._replay_task.cancel()
+                    # Replay in the background so commands are answered meanwhile
+                    self._replay_task = asyncio.create_task(
+                        self.async_replay_events(ws_resp)
+                    )
+                elif resp_queue := self.command_results.get(command_fingerprint(data)):
+                    await self.send_command_result(resp_queue.popleft(), message_id)
                 else:
                     raise ExitException(f"Unhandled command received: {data}")
+            elif msg.type == WSMsgType.PING:
+                await ws_resp.pong(msg.data)
+            elif msg.type == WSMsgType.PONG:
+                if self._pong_waiter and not self._pong_waiter.done():
+                    self._pong_waiter.set_result(None)
             elif msg.type == WSMsgType.ERROR:
                 logging.error(
                     "Connection closed with exception %s",
                     ws_resp.exception(),
                 )
 
+        if self._replay_task and self.primary_ws_resp is ws_resp:
+            self._replay_task.cancel()
+            self._replay_task = None
         logging.info("Connection closed")
 
         return ws_resp
@@ -217,34 +368,17 @@ class MockZwaveJsServer:
         return web.Response(status=200)
 
 
-def _hashable_value(item: dict | list | Hashable) -> tuple | list | Hashable:
-    """Return hashable value from item."""
-    if isinstance(item, dict):
-        return make_dict_hashable(item)
-    if isinstance(item, list):
-        return make_list_hashable(item)
-    return item
-
-
-def make_list_hashable(lst: list) -> tuple:
-    """Make a list hashable."""
-    return tuple(_hashable_value(item) for item in lst)
-
-
-def make_dict_hashable(dct: dict) -> HashableDict:
-    """Convert a dictionary to a hashable dictionary."""
-    return HashableDict({key: _hashable_value(value) for key, value in dct.items()})
-
+def command_fingerprint(msg: dict) -> bytes | str:
+    """Return the fingerprint of a command message, ignoring its message ID.
 
-def sanitize_msg(msg: dict) -> HashableDict:
-    """Sanitize command message."""
-    msg = msg.copy()
-    msg.pop("messageId", None)
-    return make_dict_hashable(msg)
+    Command messages are equal when their fingerprints are equal, so commands can be
+    matched with a single dictionary lookup.
+    """
+    return canonical_dumps({key: val for key, val in msg.items() if key != "messageId"})
 
 
 def add_command_result(
-    command_results: defaultdict[HashableDict, list],
+    command_results: defaultdict[bytes | str, deque],
     record: dict,
 ) -> None:
     """Add a command result to command_results map."""
@@ -255,11 +389,72 @@ def add_command_result(
             record,
         )
         return
-    command_msg = sanitize_msg(record["command_msg"])
-    # Response message doesn't need to be sanitized here because it will be sanitized
-    # in the MockZwaveJsServer.send_command_result method.
+    fingerprint = command_fingerprint(record["command_msg"])
+    # The response is stored as recorded. MockZwaveJsServer.send_command_result sends
+    # a copy of it with the message ID of the command that was received.
     result_msg = record["result_msg"]
-    command_results[command_msg].append(result_msg)
+    command_results[fingerprint].append(result_msg)
+
+
+def _clone_node_event(record: dict, node_id: int) -> dict:
+    """Return a copy of an event record for another node."""
+    record = copy.deepcopy(record)
+    event = record["event_msg"]["event"]
+    event["nodeId"] = node_id
+    if isinstance(args := event.get("args"), dict) and "nodeId" in args:
+        args["nodeId"] = node_id
+    return record
+
+
+def clone_nodes(
+    network_state_dump: list[dict], events_to_replay: list[dict], count: int
+) -> list[dict]:
+    """Add count clones of every node to the network state dump.
+
+    Clones of node N get the node IDs N + offset, N + 2 * offset, ... where offset is
+    the highest node ID. Returns the events to replay with every node event followed
+    by the same event for each clone of the node.
+    """
+    state = network_state_dump[2]["result"]["state"]
+    own_node_id = state["controller"].get("ownNodeId")
+    nodes = [node for node in state["nodes"] if node["nodeId"] != own_node_id]
+    if not nodes:
+        return events_to_replay
+    offset = max(node["nodeId"] for node in state["nodes"])
+    clone_ids: dict[int, list[int]] = {}
+    for node in nodes:
+        clone_ids[node["nodeId"]] = []
+        for idx in range(1, count + 1):
+            node_id = node["nodeId"] + idx * offset
+            clone_ids[node["nodeId"]].append(node_id)
+            clone = copy.deepcopy(node)
+            clone["nodeId"] = node_id
+            for endpoint in clone.get("endpoints", []):
+                endpoint["nodeId"] = node_id
+            for value in clone.get("values", []):
+                if "nodeId" in value:
+                    value["nodeId"] = node_id
+            state["nodes"].append(clone)
+
+    cloned_events = []
+    for record in events_to_replay:
+        cloned_events.append(record)
+        event = record["event_msg"]["event"]
+        if event.get("source") == "node" and event.get("nodeId") in clone_ids:
+            cloned_events.extend(
+                _clone_node_event(record, node_id)
+                for node_id in clone_ids[event["nodeId"]]
+            )
+    return cloned_events
+
+
+def load_records(path: str) -> list[dict]:
+    """Load records from a JSON dump or a JSON Lines journal (.jsonl) file."""
+    if path.endswith(".jsonl"):
+        return list(read_journal(path))
+    with open(path, encoding="utf8") as fp:
+        records: list[dict] = json.load(fp)
+    return records
 
 
 def get_args() -> argparse.Namespace:
@@ -303,11 +498,55 @@ def get_args() -> argparse.Namespace:
         "--combined-replay-dump-path",
         type=str,
         help=(
-            "File path to the combined event and command result dump JSON. Events and "
-            "command results will be extracted in the order they were received."
+            "File path to the combined event and command result dump JSON, or to a "
+            "message journal if the file name ends with .jsonl. Events and command "
+            "results will be extracted in the order they were received."
         ),
         default=None,
     )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        help=(
+            "Replay events with their recorded timing sped up by this factor. Events "
+            "are replayed as fast as possible when neither --replay-speed nor "
+            "--replay-rate is set."
+        ),
+        default=None,
+    )
+    parser.add_argument(
+        "--replay-rate",
+        type=float,
+        help="Replay events at this rate in events per second.",
+        default=None,
+    )
+    parser.add_argument(
+        "--replay-loops",
+        type=int,
+        help=(
+            "Number of times the events are replayed (defaults to 1). Use 0 to "
+            "replay the events until the client disconnects."
+        ),
+        default=1,
+    )
+    parser.add_argument(
+        "--replay-delay",
+        type=float,
+        help=(
+            "Seconds to wait after the client started listening before the events "
+            "are replayed (defaults to 1)."
+        ),
+        default=1.0,
+    )
+    parser.add_argument(
+        "--clone-nodes",
+        type=int,
+        help=(
+            "Add this many clones of every node (except the controller node) to the "
+            "network state, and replay the node events of each node for its clones."
+        ),
+        default=0,
+    )
     return parser.parse_args()
 
 
@@ -318,65 +557,71 @@ def main() -> None:
     with open(args.network_state_path, encoding="utf8") as fp:
         network_state_dump: list[dict] = json.load(fp)
 
-    events_to_replay = []
-    command_results: defaultdict[HashableDict, list] = defaultdict(list)
+    events_to_replay: list[dict] = []
+    command_results: defaultdict[bytes | str, deque] = defaultdict(deque)
 
     if args.combined_replay_dump_path:
-        with open(args.combined_replay_dump_path, encoding="utf8") as fp:
-            records: list[dict] = json.load(fp)
-
-            for record in records:
-                if record.get("record_type") not in ("event", "command"):
-                    raise ExitException(
-                        f"Invalid record in combined replay dump file: {record}"
-                    )
-                if record["record_type"] == "event":
-                    events_to_replay.append(record["event_msg"])
-                else:
-                    add_command_result(command_results, record)
-
-    if args.events_to_replay_path:
-        with open(args.events_to_replay_path, encoding="utf8") as fp:
-            records = json.load(fp)
-            if (
-                bad_record := next(
-                    (
-                        record
-                        for record in records
-                        if record.get("record_type") != "event"
-                    ),
-                    None,
-                )
-            ) is not None:
+        for record in load_records(args.combined_replay_dump_path):
+            if record.get("record_type") not in ("event", "command"):
                 raise ExitException(
-                    f"Malformed record in events to replay file: {bad_record}"
+                    f"Invalid record in combined replay dump file: {record}"
                 )
-            events_to_replay.extend([record["event_msg"] for record in records])
+            if record["record_type"] == "event":
+                events_to_replay.append(record)
+            else:
+                add_command_result(command_results, record)
+
+    if args.events_to_replay_path:
+        records = load_records(args.events_to_replay_path)
+        if (
+            bad_record := next(
+                (record for record in records if record.get("record_type") != "event"),
+                None,
+            )
+        ) is not None:
+            raise ExitException(
+                f"Malformed record in events to replay file: {bad_record}"
+            )
+        events_to_replay.extend(records)
 
     if args.command_results_path:
-        with open(args.command_results_path, encoding="utf8") as fp:
-            records = json.load(fp)
-            if (
-                bad_record := next(
-                    (
-                        record
-                        for record in records
-                        if record.get("record_type") != "command"
-                    ),
-                    None,
-                )
-            ) is not None:
-                raise ExitException(
-                    f"Malformed record in command results dump file: {bad_record}"
-                )
-            for record in records:
-                add_command_result(command_results, record)
+        records = load_records(args.command_results_path)
+        if (
+            bad_record := next(
+                (
+                    record
+                    for record in records
+                    if record.get("record_type") != "command"
+                ),
+                None,
+            )
+        ) is not None:
+            raise ExitException(
+                f"Malformed record in command results dump file: {bad_record}"
+            )
+        for record in records:
+            add_command_result(command_results, record)
 
     # adapted from homeassistant.bootstrap.async_enable_logging
     logging.basicConfig(level=args.log_level)
     logging.getLogger().handlers[0].setFormatter(logging_formatter)
 
-    server = MockZwaveJsServer(network_state_dump, events_to_replay, command_results)
+    if args.clone_nodes:
+        events_to_replay = clone_nodes(
+            network_state_dump, events_to_replay, args.clone_nodes
+        )
+
+    server = MockZwaveJsServer(
+        network_state_dump,
+        events_to_replay,
+        command_results,
+        ReplayOptions(
+            speed=args.replay_speed,
+            rate=args.replay_rate,
+            loops=args.replay_loops,
+            delay=args.replay_delay,
+        ),
+    )
     web.run_app(server.app, host=args.host, port=args.port)
 
 
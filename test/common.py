@@ -20,7 +20,7 @@ def update_ws_client_msg_queue(fixture, new_messages):
     for message in new_messages:
         to_receive.put_nowait(message)
 
-    async def receive_json():
+    async def receive_json(**kwargs):
         return await to_receive.get()
 
     fixture.receive_json = AsyncMock(side_effect=receive_json)
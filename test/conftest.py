@@ -209,7 +209,7 @@ async def ws_client_fixture(
 
     ws_client.receive.side_effect = receive
 
-    async def close_client(msg: dict[str, Any]) -> None:
+    async def close_client(msg: dict[str, Any], **kwargs: Any) -> None:
         """Close the client."""
         if msg["command"] in ("initialize", "start_listening"):
             return
@@ -325,11 +325,13 @@ def ws_message_fixture(result: dict[str, Any]) -> Mock:
 
 @pytest.fixture(name="uuid4")
 def mock_uuid_fixture() -> Generator[str, None, None]:
-    """Patch uuid4."""
-    uuid4_hex = "1234"
-    with patch("uuid.uuid4") as uuid4:
-        uuid4.return_value.hex = uuid4_hex
-        yield uuid4_hex
+    """Patch the message ID generator."""
+    message_id = "1234"
+    with patch(
+        "zwave_js_server.util.message_id.MessageIdGenerator.__call__",
+        return_value=message_id,
+    ):
+        yield message_id
 
 
 @pytest.fixture(name="client")
@@ -366,7 +368,7 @@ def mock_command_fixture(
         mock_responses.append((match_command, response, success))
         return ack_commands
 
-    async def set_response(message: dict[str, Any]) -> None:
+    async def set_response(message: dict[str, Any], **kwargs: Any) -> None:
         """Check the message and set the mocked response if a command matches."""
         for match_command, response, success in mock_responses:
             if all(message[key] == value for key, value in match_command.items()):
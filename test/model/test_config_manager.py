@@ -1,8 +1,17 @@
 """Test the config manager."""
 
+import asyncio
+from copy import deepcopy
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
 from zwave_js_server.client import Client
 from zwave_js_server.model.config_manager import ConfigManager
 from zwave_js_server.model.device_config import DeviceConfigDataType
+from zwave_js_server.model.driver import Driver
+from zwave_js_server.model.log_config import LogConfigDataType
 
 from ..common import MockCommandProtocol
 
@@ -71,3 +80,146 @@ async def test_lookup_device(
     result = await config_manager.lookup_device(0x4321, 0x8765, 0xCBA9)
 
     assert result is None
+
+
+async def test_lookup_device_cache(
+    driver: Driver,
+    mock_command: MockCommandProtocol,
+    device_config: DeviceConfigDataType,
+    tmp_path: Path,
+) -> None:
+    """Test that device lookups are cached per config DB version."""
+    driver.data["configVersion"] = "2026.3.0"
+    cache_path = tmp_path / "lookups.jsonl"
+    config_manager = ConfigManager(driver.client, cache_size=2, cache_path=cache_path)
+    ack_commands = mock_command(
+        {"command": "config_manager.lookup_device", "manufacturerId": 0x1234},
+        {"config": device_config},
+    )
+    mock_command(
+        {"command": "config_manager.lookup_device", "manufacturerId": 0x4321},
+        {"config": None},
+    )
+
+    result = await config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    assert result is not None
+    result.data["label"] = "Changed"
+
+    # Cached lookups return a new instance that doesn't share the cached data
+    cached_result = await config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    assert cached_result is not None
+    assert cached_result is not result
+    assert cached_result.to_dict() == device_config
+    assert len(ack_commands) == 1
+
+    # Devices that aren't found are cached too
+    assert await config_manager.lookup_device(0x4321, 0x8765, 0xCBA9) is None
+    assert await config_manager.lookup_device(0x4321, 0x8765, 0xCBA9) is None
+    assert len(ack_commands) == 2
+
+    # The firmware version is part of the key
+    await config_manager.lookup_device(0x1234, 0x5678, 0x9ABC, "1.5")
+    assert len(ack_commands) == 3
+
+    # The least recently used lookup was evicted from memory, but is read from disk
+    result = await config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    assert result is not None
+    assert result.to_dict() == device_config
+    assert len(ack_commands) == 3
+
+    # The cache on disk is kept across config managers
+    other_config_manager = ConfigManager(driver.client, cache_path=cache_path)
+    assert await other_config_manager.lookup_device(0x4321, 0x8765, 0xCBA9) is None
+    assert len(ack_commands) == 3
+
+    # A new config DB version doesn't use the cached lookups
+    driver.data["configVersion"] = "2026.4.0"
+    await config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    assert len(ack_commands) == 4
+
+    # Lookups of other config DB versions are pruned from the cache on disk
+    records = [json.loads(line) for line in cache_path.read_text().splitlines()]
+    assert [record["key"] for record in records] == [
+        [0x1234, 0x5678, 0x9ABC, None, "2026.4.0"]
+    ]
+
+
+async def test_lookup_device_cache_concurrent(
+    driver: Driver,
+    mock_command: MockCommandProtocol,
+    device_config: DeviceConfigDataType,
+    tmp_path: Path,
+) -> None:
+    """Test that concurrent lookups load the cache on disk once."""
+    driver.data["configVersion"] = "2026.3.0"
+    cache_path = tmp_path / "lookups.jsonl"
+    cache_path.write_text(
+        json.dumps({"key": [0x1234, 0x5678, 0, None, "2026.2.0"], "config": None})
+        + "\n"
+    )
+    config_manager = ConfigManager(driver.client, cache_path=cache_path)
+    ack_commands = mock_command(
+        {"command": "config_manager.lookup_device"},
+        {"config": device_config},
+    )
+
+    with patch.object(
+        config_manager,
+        "_load_disk_cache",
+        wraps=config_manager._load_disk_cache,  # pylint: disable=protected-access
+    ) as load_disk_cache:
+        results = await asyncio.gather(
+            *(
+                config_manager.lookup_device(0x1234, 0x5678, product_id)
+                for product_id in range(1, 6)
+            )
+        )
+    assert all(result is not None for result in results)
+    assert load_disk_cache.call_count == 1
+    assert len(ack_commands) == 5
+
+    # Every lookup was appended as a complete record
+    records = [json.loads(line) for line in cache_path.read_text().splitlines()]
+    assert sorted(record["key"][2] for record in records) == [1, 2, 3, 4, 5]
+
+
+async def test_lookup_device_cache_path_from_client(
+    client: Client,
+    controller_state: dict[str, Any],
+    log_config: LogConfigDataType,
+    tmp_path: Path,
+) -> None:
+    """Test that the driver uses the device lookup cache path of the client."""
+    client.device_lookup_cache_path = tmp_path / "lookups.jsonl"
+    driver = Driver(client, deepcopy(controller_state), log_config)
+    assert driver.config_manager.cache_path == tmp_path / "lookups.jsonl"
+
+
+async def test_lookup_device_cache_invalidation(
+    driver: Driver,
+    mock_command: MockCommandProtocol,
+    device_config: DeviceConfigDataType,
+    tmp_path: Path,
+) -> None:
+    """Test that cached lookups are invalidated by an installed config update."""
+    driver.data["configVersion"] = "2026.3.0"
+    cache_path = tmp_path / "lookups.jsonl"
+    driver.config_manager.cache_path = cache_path
+    ack_commands = mock_command(
+        {"command": "config_manager.lookup_device"},
+        {"config": device_config},
+    )
+    mock_command({"command": "driver.install_config_update"}, {"success": True})
+
+    await driver.config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    await driver.config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    assert len(ack_commands) == 1
+    assert cache_path.exists()
+
+    assert await driver.async_install_config_update()
+    assert not cache_path.exists()
+
+    # The driver still reports the old config DB version, so lookups aren't cached
+    await driver.config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    await driver.config_manager.lookup_device(0x1234, 0x5678, 0x9ABC)
+    assert len(ack_commands) == 4
@@ -182,6 +182,19 @@ def test_controller_mods(client):
     assert ctrl.supports_long_range is True
 
 
+def test_controller_consumes_node_states(client):
+    """Test that a controller that owns the state releases the node states."""
+    state = json.loads(load_fixture("basic_dump.txt").split("\n")[0])["result"]["state"]
+    node_ids = [node_state["nodeId"] for node_state in state["nodes"]]
+
+    ctrl = controller_pkg.Controller(client, deepcopy(state))
+    assert list(ctrl.nodes) == node_ids
+
+    ctrl = controller_pkg.Controller(client, state, copy_data=False)
+    assert list(ctrl.nodes) == node_ids
+    assert state["nodes"] == []
+
+
 def test_controller_status():
     """Test controller status functionality."""
     state = json.loads(load_fixture("basic_dump.txt").split("\n")[0])["result"]["state"]
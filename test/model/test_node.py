@@ -60,6 +60,7 @@ from zwave_js_server.model.value import (
     ConfigurationValue,
     ConfigurationValueFormat,
     SetConfigParameterResult,
+    ValueID,
     get_value_id_str,
 )
 
@@ -344,6 +345,235 @@ async def test_command_class_values(climate_radio_thermostat_ct100_plus):
         await node.async_set_value("13-112-0-2", 1)
 
 
+def _scan_command_class_values(node, command_class, endpoint=None):
+    """Return command class values by scanning all node values."""
+    return {
+        value_id: value
+        for value_id, value in node.values.items()
+        if value.command_class == command_class
+        and (endpoint is None or value.endpoint == endpoint)
+    }
+
+
+async def test_command_class_values_index(multisensor_6):
+    """Test that the value indexes follow value changes."""
+    node = multisensor_6
+    for value in node.values.values():
+        for endpoint in (None, value.endpoint):
+            assert node.get_command_class_values(
+                value.command_class, endpoint
+            ) == _scan_command_class_values(node, value.command_class, endpoint)
+    assert node.get_command_class_values(CommandClass.DOOR_LOCK) == {}
+
+    # Value added without an endpoint
+    args = {
+        "commandClassName": "Binary Sensor",
+        "commandClass": 48,
+        "property": "test",
+        "propertyName": "test",
+        "newValue": True,
+        "metadata": {"type": "boolean", "readable": True, "writeable": False},
+    }
+    event = Event(
+        "value added",
+        {
+            "source": "node",
+            "event": "value added",
+            "nodeId": node.node_id,
+            "args": dict(args),
+        },
+    )
+    node.receive_event(event)
+    assert "52-48-0-test" in node.get_command_class_values(CommandClass.SENSOR_BINARY)
+    assert "52-48-0-test" not in node.get_command_class_values(
+        CommandClass.SENSOR_BINARY, 0
+    )
+
+    # The endpoint changes from None to 0 without changing the value ID
+    event = Event(
+        "value updated",
+        {
+            "source": "node",
+            "event": "value updated",
+            "nodeId": node.node_id,
+            "args": {**args, "endpoint": 0, "prevValue": True, "newValue": False},
+        },
+    )
+    node.receive_event(event)
+    assert node.get_command_class_values(
+        CommandClass.SENSOR_BINARY, 0
+    ) == _scan_command_class_values(node, CommandClass.SENSOR_BINARY, 0)
+    assert "52-48-0-test" in node.get_command_class_values(
+        CommandClass.SENSOR_BINARY, 0
+    )
+    endpoint = node.endpoints[0]
+    assert endpoint.get_command_class_values(CommandClass.SENSOR_MULTILEVEL) == {
+        value_id: value
+        for value_id, value in endpoint.values.items()
+        if value.command_class == CommandClass.SENSOR_MULTILEVEL
+    }
+
+    event = Event(
+        "value removed",
+        {
+            "source": "node",
+            "event": "value removed",
+            "nodeId": node.node_id,
+            "args": {**args, "endpoint": 0},
+        },
+    )
+    node.receive_event(event)
+    assert "52-48-0-test" not in node.get_command_class_values(
+        CommandClass.SENSOR_BINARY
+    )
+    assert node.get_command_class_values(
+        CommandClass.SENSOR_BINARY
+    ) == _scan_command_class_values(node, CommandClass.SENSOR_BINARY)
+
+
+async def test_on_value(multisensor_6):
+    """Test listening to the events of a single value."""
+    node = multisensor_6
+    value_id = "52-48-0-test"
+    calls = []
+    other_calls = []
+    unsub = node.on_value(value_id, calls.append)
+    node.on_value(ValueID(52, 49, 0, "Air temperature"), other_calls.append)
+
+    args = {
+        "commandClassName": "Binary Sensor",
+        "commandClass": 48,
+        "endpoint": 0,
+        "property": "test",
+        "propertyName": "test",
+        "newValue": True,
+        "metadata": {"type": "boolean", "readable": True, "writeable": False},
+    }
+    for event_type in ("value added", "value updated", "value removed"):
+        node.receive_event(
+            Event(
+                event_type,
+                {
+                    "source": "node",
+                    "event": event_type,
+                    "nodeId": node.node_id,
+                    "args": dict(args),
+                },
+            )
+        )
+    assert [data["event"] for data in calls] == [
+        "value added",
+        "value updated",
+        "value removed",
+    ]
+    assert all(data["node"] is node for data in calls)
+    assert all(data["value"].value_id == value_id for data in calls)
+    assert not other_calls
+
+    unsub()
+    node.receive_event(
+        Event(
+            "value added",
+            {
+                "source": "node",
+                "event": "value added",
+                "nodeId": node.node_id,
+                "args": dict(args),
+            },
+        )
+    )
+    assert len(calls) == 3
+
+
+async def test_update_emit_value_events(client, multisensor_6_state):
+    """Test that a node update can emit events for the values that changed."""
+    node = Node(client, deepcopy(multisensor_6_state))
+    events = []
+    for event_type in (
+        "value added",
+        "value updated",
+        "metadata updated",
+        "value removed",
+    ):
+        node.on(event_type, events.append)
+
+    state = deepcopy(multisensor_6_state)
+    removed = state["values"].pop(0)
+    added = {**state["values"][0], "property": "test", "propertyName": "test"}
+    state["values"].append(added)
+    state["values"][1]["metadata"]["label"] = "New label"
+    node.update(deepcopy(state), emit_value_events=True)
+    events_by_type = {data["event"]: data for data in events}
+    assert len(events) == len(events_by_type) == 3
+    assert events_by_type["value removed"]["args"]["property"] == removed["property"]
+    added_value = events_by_type["value added"]["value"]
+    assert added_value.property_ == "test"
+    assert added_value is node.values[added_value.value_id]
+    metadata_updated = events_by_type["metadata updated"]
+    assert metadata_updated["args"]["property"] == state["values"][1]["property"]
+    assert metadata_updated["args"]["metadata"]["label"] == "New label"
+
+    # Nothing changed
+    events.clear()
+    node.update(deepcopy(state), emit_value_events=True)
+    assert not events
+
+
+async def test_endpoint_values_live(client, climate_radio_thermostat_ct100_plus_state):
+    """Test that endpoint values follow value changes of the node."""
+    node = Node(client, deepcopy(climate_radio_thermostat_ct100_plus_state))
+    endpoint = node.endpoints[1]
+    endpoint_values = endpoint.values
+    assert endpoint_values == {
+        value_id: value
+        for value_id, value in node.values.items()
+        if value.endpoint == 1
+    }
+
+    args = {
+        "commandClassName": "Binary Sensor",
+        "commandClass": 48,
+        "endpoint": 1,
+        "property": "test",
+        "propertyName": "test",
+        "newValue": True,
+        "metadata": {"type": "boolean", "readable": True, "writeable": False},
+    }
+    event = Event(
+        "value added",
+        {
+            "source": "node",
+            "event": "value added",
+            "nodeId": node.node_id,
+            "args": dict(args),
+        },
+    )
+    node.receive_event(event)
+    assert endpoint.values["13-48-1-test"] is node.values["13-48-1-test"]
+
+    event = Event(
+        "value removed",
+        {
+            "source": "node",
+            "event": "value removed",
+            "nodeId": node.node_id,
+            "args": dict(args),
+        },
+    )
+    node.receive_event(event)
+    assert "13-48-1-test" not in endpoint.values
+
+    # The endpoint keeps its view when the node is updated
+    node.update(deepcopy(climate_radio_thermostat_ct100_plus_state))
+    assert node.endpoints[1] is endpoint
+    assert endpoint.values is endpoint_values
+    assert endpoint.values == {
+        value_id: value
+        for value_id, value in node.values.items()
+        if value.endpoint == 1
+    }
+
+
 async def test_set_value(multisensor_6, uuid4, mock_command):
     """Test set value."""
     node = multisensor_6
@@ -631,6 +861,73 @@ async def test_abort_firmware_update(multisensor_6, uuid4, mock_command):
     }
 
 
+async def test_shared_device_config(client, multisensor_6_state):
+    """Test that nodes with equal device configs share one DeviceConfig."""
+    other_state = deepcopy(multisensor_6_state)
+    other_state["nodeId"] = 99
+    for endpoint in other_state["endpoints"]:
+        endpoint["nodeId"] = 99
+    node = node_pkg.Node(client, deepcopy(multisensor_6_state))
+    other_node = node_pkg.Node(client, other_state)
+    assert node.device_config is other_node.device_config
+
+    # The node data shares the device config dict
+    assert node.data["deviceConfig"] is node.device_config.data
+    assert other_node.data["deviceConfig"] is node.device_config.data
+    assert len(client.device_config_cache) == 1
+
+    # Device configs for the same device that differ aren't shared
+    different_state = deepcopy(other_state)
+    different_state["nodeId"] = 100
+    for endpoint in different_state["endpoints"]:
+        endpoint["nodeId"] = 100
+    different_state["deviceConfig"]["paramInformation"] = {}
+    different_node = node_pkg.Node(client, different_state)
+    assert different_node.device_config is not node.device_config
+    assert different_node.device_config.label == "ZW100"
+    assert len(client.device_config_cache) == 2
+
+    # A ready event with the same device config keeps sharing it
+    node.receive_event(
+        Event(
+            "ready",
+            {
+                "event": "ready",
+                "source": "node",
+                "nodeId": node.node_id,
+                "nodeState": deepcopy(multisensor_6_state),
+                "result": [],
+            },
+        )
+    )
+    assert node.device_config is other_node.device_config
+
+    # A changed device config replaces the cached one for this node only
+    new_state = deepcopy(multisensor_6_state)
+    new_state["deviceConfig"]["label"] = "New label"
+    old_device_config = node.device_config
+    node.receive_event(
+        Event(
+            "ready",
+            {
+                "event": "ready",
+                "source": "node",
+                "nodeId": node.node_id,
+                "nodeState": new_state,
+                "result": [],
+            },
+        )
+    )
+    assert node.device_config.label == "New label"
+    assert other_node.device_config is old_device_config
+    assert other_node.device_config.label != "New label"
+
+    # Nodes added later no longer get the old device config
+    added_node = node_pkg.Node(client, deepcopy(multisensor_6_state))
+    assert added_node.device_config is not old_device_config
+    assert added_node.device_config.data == old_device_config.data
+
+
 def test_node_inclusion(multisensor_6_state):
     """Emulate a node being added."""
     # when a node node is added, it has minimal info first
@@ -650,7 +947,7 @@ def test_node_inclusion(multisensor_6_state):
             "event": "ready",
             "source": "node",
             "nodeId": node.node_id,
-            "nodeState": multisensor_6_state,
+            "nodeState": deepcopy(multisensor_6_state),
             "result": [],
         },
     )
@@ -703,7 +1000,7 @@ def test_node_inclusion(multisensor_6_state):
             "event": "ready",
             "source": "node",
             "nodeId": node.node_id,
-            "nodeState": multisensor_6_state,
+            "nodeState": deepcopy(multisensor_6_state),
             "result": [],
         },
     )
@@ -730,7 +1027,7 @@ def test_node_ready_event(switch_enbrighten_zw3010_state):
             "event": "ready",
             "source": "node",
             "nodeId": node.node_id,
-            "nodeState": switch_enbrighten_zw3010_state,
+            "nodeState": deepcopy(switch_enbrighten_zw3010_state),
             "result": [],
         },
     )
@@ -740,6 +1037,39 @@ def test_node_ready_event(switch_enbrighten_zw3010_state):
     assert len(node.values) > 0
 
 
+def test_node_update_copy_data(multisensor_6_state):
+    """Test that the node only copies state data when asked to."""
+    state = deepcopy(multisensor_6_state)
+    node = node_pkg.Node(None, state)
+    assert state == multisensor_6_state
+    assert node.data["deviceConfig"] is not state["deviceConfig"]
+
+    # The node takes ownership of the data without copying it
+    state = deepcopy(multisensor_6_state)
+    node = node_pkg.Node(None, state, copy_data=False)
+    assert node.data["deviceConfig"] is state["deviceConfig"]
+    assert node.endpoints[0].data is state["endpoints"][0]
+    assert "values" not in node.data
+    assert "endpoints" not in node.data
+    # The top level dict of the state is left intact for other event listeners
+    assert state["values"] == multisensor_6_state["values"]
+    assert state["endpoints"] == multisensor_6_state["endpoints"]
+
+    state = deepcopy(multisensor_6_state)
+    event = Event(
+        "ready",
+        {
+            "event": "ready",
+            "source": "node",
+            "nodeId": node.node_id,
+            "nodeState": state,
+            "result": [],
+        },
+    )
+    node.receive_event(event)
+    assert node.data["deviceConfig"] is state["deviceConfig"]
+
+
 async def test_node_status_events(multisensor_6):
     """Test Node status events."""
     node = multisensor_6
@@ -1,6 +1,7 @@
 """Test value model."""
 
 from copy import deepcopy
+import gc
 
 from zwave_js_server.const import ConfigurationValueType, SetValueStatus
 from zwave_js_server.model.node import Node
@@ -10,8 +11,10 @@ from zwave_js_server.model.value import (
     ConfigurationValue,
     ConfigurationValueFormat,
     MetaDataType,
+    MetadataPool,
     SetValueResult,
     ValueDataType,
+    ValueID,
     ValueMetadata,
     get_value_id_str,
 )
@@ -39,6 +42,28 @@ def test_buffer_dict(client, idl_101_lock_state):
     assert zwave_value.value == "¤\x0eªV"
 
 
+def test_value_id(lock_schlage_be469):
+    """Test the cached value ID and the structured value ID."""
+    node = lock_schlage_be469
+    zwave_value = node.values["20-99-0-userCode-3"]
+    assert zwave_value.value_id == "20-99-0-userCode-3"
+    assert zwave_value.value_id is zwave_value.value_id
+    assert zwave_value.value_id_key == ValueID(20, 99, 0, "userCode", 3)
+    assert str(zwave_value.value_id_key) == zwave_value.value_id
+    assert str(ValueID(20, 98, 0, "targetMode")) == "20-98-0-targetMode"
+    assert node.values[str(ValueID(20, 99, 0, "userCode", 3))] is zwave_value
+
+    # The cached value ID is kept when its fields don't change
+    value_id = zwave_value.value_id
+    zwave_value.update({"commandClass": 99, "newValue": "1234"})
+    assert zwave_value.value_id is value_id
+
+    # and invalidated when they do
+    zwave_value.update({"propertyKey": 4})
+    assert zwave_value.value_id == "20-99-0-userCode-4"
+    assert zwave_value.value_id_key == ValueID(20, 99, 0, "userCode", 4)
+
+
 def test_unparseable_value(client, unparseable_json_string_value_state):
     """Test that we handle string value with unparseable format."""
     node = Node(client, unparseable_json_string_value_state)
@@ -336,3 +361,94 @@ def test_configuration_value_metadata(inovelli_switch_state):
     assert metadata.no_bulk_support
     assert metadata.value_size == 1
     assert metadata.format == ConfigurationValueFormat.SIGNED_INTEGER
+
+
+def test_value_shares_merged_metadata(lock_schlage_be469):
+    """Test that value data references the merged metadata of the value."""
+    node = lock_schlage_be469
+    zwave_value = node.values["20-112-0-3"]
+    assert not hasattr(zwave_value, "__dict__")
+    assert zwave_value.data["metadata"] is zwave_value.metadata.data
+
+    zwave_value.update(ValueDataType(metadata=MetaDataType(label="New label")))
+    assert zwave_value.data["metadata"] is zwave_value.metadata.data
+    assert zwave_value.metadata.label == "New label"
+    assert zwave_value.metadata.value_size == 1
+
+
+def test_metadata_pool():
+    """Test that equal metadata is shared and copied before it is modified."""
+    pool = MetadataPool()
+    metadata = MetaDataType(type="number", label="Level", states={"0": "Off"})
+    shared = pool.intern(metadata)
+    assert shared == metadata
+    assert shared is not metadata
+    assert pool.intern(deepcopy(metadata)) is shared
+    other = pool.intern(MetaDataType(type="number", label="Other"))
+    assert other is not shared
+    assert len(pool) == 2
+
+    first = ValueMetadata(shared, shared=True)
+    second = ValueMetadata(shared, shared=True)
+    # An update that doesn't change the metadata keeps it shared
+    first.update(MetaDataType(label="Level"))
+    assert first.data is shared
+    first.update(MetaDataType(label="Renamed"))
+    assert first.label == "Renamed"
+    assert first.data is not shared
+    assert second.label == "Level"
+    assert second.data is shared
+
+    # Once copied, the metadata is updated in place
+    data = first.data
+    first.update(MetaDataType(unit="%"))
+    assert first.data is data
+
+    pool.clear()
+    assert not len(pool)
+
+
+def test_metadata_pool_drops_unused_metadata():
+    """Test that the pool drops metadata once no value uses it anymore."""
+    pool = MetadataPool()
+    metadata = MetaDataType(type="number", label="Level")
+    shared = pool.intern(metadata)
+    other = pool.intern(MetaDataType(type="number", label="Level", min=0))
+    assert len(pool) == 2
+
+    del shared
+    gc.collect()
+    assert len(pool) == 1
+    assert pool.intern(MetaDataType(type="number", label="Level", min=0)) is other
+
+
+def test_values_share_metadata(client, multisensor_6_state):
+    """Test that values of nodes of the same model share their metadata."""
+    node_state = deepcopy(multisensor_6_state)
+    other_node_state = deepcopy(multisensor_6_state)
+    other_node_state["nodeId"] = 99
+    for endpoint in other_node_state["endpoints"]:
+        endpoint["nodeId"] = 99
+    node = Node(client, node_state)
+    other_node = Node(client, other_node_state)
+
+    value = node.values["52-49-0-Air temperature"]
+    other_value = other_node.values["99-49-0-Air temperature"]
+    assert value.metadata.data is other_value.metadata.data
+    assert value.data["metadata"] is value.metadata.data
+
+    # Updating a node with an unchanged state keeps its metadata shared
+    node.update(deepcopy(multisensor_6_state))
+    assert node.values["52-49-0-Air temperature"] is value
+    assert value.metadata.data is other_value.metadata.data
+
+    value.update(ValueDataType(metadata=MetaDataType(label="Inside temperature")))
+    assert value.metadata.label == "Inside temperature"
+    assert value.data["metadata"] is value.metadata.data
+    assert other_value.metadata.label == "Air temperature"
+
+    # Metadata of removed nodes is dropped from the pool
+    assert len(client.metadata_pool)
+    del node, other_node, value, other_value
+    gc.collect()
+    assert not len(client.metadata_pool)
@@ -1,7 +1,9 @@
 """Test the client."""
 
 import asyncio
+from copy import deepcopy
 from datetime import datetime
+import json
 import logging
 from unittest.mock import Mock, patch
 
@@ -10,12 +12,21 @@ from aiohttp.client_reqrep import ClientResponse, RequestInfo
 from aiohttp.http_websocket import WSMsgType
 import pytest
 
+from test import load_fixture
 from test.common import MockCommandProtocol
-from zwave_js_server.client import LOGGER, Client
-from zwave_js_server.const import MAX_SERVER_SCHEMA_VERSION, LogLevel, __version__
-from zwave_js_server.event import Event
+from test.conftest import create_ws_message
+from zwave_js_server.client import LOGGER, SIZE_PARSE_JSON_EXECUTOR, Client
+from zwave_js_server.const import (
+    MAX_SERVER_SCHEMA_VERSION,
+    CommandPriority,
+    LogLevel,
+    NodeStatus,
+    __version__,
+)
+from zwave_js_server.event import Event, EventValidationMode, EventValidationStats
 from zwave_js_server.exceptions import (
     CannotConnect,
+    CommandTimeout,
     ConnectionFailed,
     FailedCommand,
     FailedZWaveCommand,
@@ -26,6 +37,8 @@ from zwave_js_server.exceptions import (
 )
 from zwave_js_server.model.driver import Driver
 from zwave_js_server.model.log_config import LogConfig
+from zwave_js_server.util.journal import MessageJournal, read_journal
+from zwave_js_server.util.json import JSONCodec
 
 
 async def test_connect_disconnect(client_session, url):
@@ -585,3 +598,343 @@ async def test_log_server(
         await client.enable_server_logging()
 
     client.disable_server_logging()
+
+
+async def test_json_codec(client_session, url, ws_client, driver_ready):
+    """Test that the client uses the configured JSON codec."""
+    codec = JSONCodec(name="test", loads=json.loads, dumps=json.dumps)
+    client = Client(url, client_session, json_codec=codec)
+    assert client.json_codec is codec
+    await client.connect()
+    assert client.connected
+
+    await client.listen(driver_ready)
+
+    assert ws_client.send_json.call_count == 3
+    for call_ in ws_client.send_json.call_args_list:
+        assert call_.kwargs == {"dumps": json.dumps}
+
+
+async def test_parse_stats(client_session, url, driver_ready):
+    """Test that received messages are timed and the stats are exposed."""
+    client = Client(url, client_session)
+    assert client.parse_executor_threshold == SIZE_PARSE_JSON_EXECUTOR
+    assert client.parse_stats == []
+
+    await client.connect()
+    await client.listen(driver_ready)
+
+    assert sum(bucket.count for bucket in client.parse_stats) == 4
+    assert client._parse_executor is None  # pylint: disable=protected-access
+
+
+async def test_event_validation(client_session, url, driver_ready):
+    """Test that the client validates events according to the validation mode."""
+    client = Client(
+        url,
+        client_session,
+        event_validation=EventValidationMode.OFF,
+    )
+    await client.connect()
+    await client.listen(driver_ready)
+    assert client.driver
+
+    client.driver.receive_event(
+        Event("inclusion failed", {"source": "controller", "event": "inclusion failed"})
+    )
+    assert client.event_validation_stats == EventValidationStats(
+        validated=0, skipped=1, failures=0
+    )
+
+
+async def test_resync_on_reconnect(
+    client_session,
+    url,
+    ws_client,
+    messages,
+    result,
+    multisensor_6_state,
+    lock_schlage_be469_state,
+):
+    """Test that the driver is kept and resynced after a reconnect."""
+    # The version, initialize and log config messages of a connection
+    connect_messages = list(messages)[:3]
+
+    def queue_connection(nodes, home_id=None):
+        """Queue the messages of a new connection with the given nodes."""
+        state_result = deepcopy(result)
+        state = state_result["result"]["state"]
+        state["nodes"] = deepcopy(nodes)
+        if home_id is not None:
+            state["controller"]["homeId"] = home_id
+        messages.clear()
+        messages.extend([*connect_messages, create_ws_message(state_result)])
+        ws_client.closed = False
+
+    queue_connection([multisensor_6_state, lock_schlage_be469_state])
+    client = Client(url, client_session, resync_on_reconnect=True)
+    await client.connect()
+    await client.listen(asyncio.Event())
+    driver = client.driver
+    assert driver
+    node = driver.controller.nodes[52]
+    lock = driver.controller.nodes[20]
+    events = []
+    value_events = []
+    status_events = []
+    removed_events = []
+    added_events = []
+    node.on("value updated", events.append)
+    node.on_value("52-49-0-Air temperature", value_events.append)
+    node.on("dead", status_events.append)
+    driver.controller.on("node removed", removed_events.append)
+    driver.controller.on("node added", added_events.append)
+    assert node.status == NodeStatus.ASLEEP
+    assert not node.status_event.is_set()
+
+    # While disconnected, the temperature changed, the node died, the lock was
+    # removed and a switch was added
+    node_state = deepcopy(multisensor_6_state)
+    node_state["status"] = NodeStatus.DEAD
+    for value in node_state["values"]:
+        if value["commandClass"] == 49 and value["property"] == "Air temperature":
+            value["value"] = 10
+    switch_state = json.loads(load_fixture("inovelli_switch_state.json"))
+    queue_connection([node_state, switch_state])
+    await client.connect()
+    await client.listen(asyncio.Event())
+
+    assert client.driver is driver
+    switch = driver.controller.nodes[31]
+    assert driver.controller.nodes == {52: node, 31: switch}
+    assert lock.client is None
+    assert len(removed_events) == 1
+    assert removed_events[0]["node"] is lock
+    assert removed_events[0]["reason"] is None
+    assert removed_events[0]["controller"] is driver.controller
+    assert len(added_events) == 1
+    assert added_events[0]["node"] is switch
+    assert added_events[0]["result"] is None
+    assert len(status_events) == 1
+    assert status_events[0]["node"] is node
+    assert node.status == NodeStatus.DEAD
+    assert node.status_event.is_set()
+    assert len(events) == 1
+    assert value_events == events
+    assert events[0]["node"] is node
+    assert events[0]["value"] is node.values["52-49-0-Air temperature"]
+    assert events[0]["args"]["prevValue"] == 9
+    assert events[0]["args"]["newValue"] == 10
+    assert node.values["52-49-0-Air temperature"].value == 10
+
+    # A dump of another network can't be applied to the driver
+    queue_connection([node_state], home_id=1)
+    await client.connect()
+    with pytest.raises(InvalidState):
+        await client.listen(asyncio.Event())
+    assert client.driver is driver
+
+
+async def test_command_window(client_session, url, ws_client):
+    """Test that commands wait for a free slot in priority order."""
+    client = Client(url, client_session, max_commands_in_flight=1)
+    await client.connect()
+    ws_client.send_json.side_effect = None
+
+    def resolve_last_sent_command():
+        """Resolve the last sent command."""
+        message = ws_client.send_json.call_args.args[0]
+        client._handle_incoming_message(  # pylint: disable=protected-access
+            {
+                "type": "result",
+                "success": True,
+                "messageId": message["messageId"],
+                "result": {"command": message["command"]},
+            }
+        )
+
+    message_ids = iter(range(3))
+    with patch(
+        "zwave_js_server.util.message_id.MessageIdGenerator.__call__",
+        side_effect=lambda: str(next(message_ids)),
+    ):
+        tasks = [
+            asyncio.create_task(client.async_send_command({"command": command}))
+            for command in ("node.poll_value", "node.refresh_values", "node.set_value")
+        ]
+        await asyncio.sleep(0)
+        assert client.command_queue_stats.in_flight == 1
+        assert client.command_queue_stats.queued == {
+            CommandPriority.HIGH: 1,
+            CommandPriority.NORMAL: 0,
+            CommandPriority.LOW: 1,
+        }
+
+        for _ in tasks:
+            resolve_last_sent_command()
+            # Let the next command take the free slot and send its message
+            for _ in range(3):
+                await asyncio.sleep(0)
+        results = await asyncio.gather(*tasks)
+
+    assert [
+        call_.args[0]["command"] for call_ in ws_client.send_json.call_args_list[-3:]
+    ] == ["node.poll_value", "node.set_value", "node.refresh_values"]
+    assert [result["command"] for result in results] == [
+        "node.poll_value",
+        "node.refresh_values",
+        "node.set_value",
+    ]
+    assert client.command_queue_stats.in_flight == 0
+
+
+async def test_command_timeout(client_session, url, ws_client):
+    """Test that commands without a result time out."""
+    client = Client(url, client_session, command_timeout=0.01)
+    await client.connect()
+    ws_client.send_json.side_effect = None
+
+    with pytest.raises(CommandTimeout) as err:
+        await client.async_send_command({"command": "node.ping"})
+    assert err.value.timeout == 0.01
+    assert err.value.error_code == "timeout"
+    assert client.pending_command_count == 0
+
+    # The timeout can be set per command
+    task = asyncio.create_task(
+        client.async_send_command({"command": "node.ping"}, timeout=0.05)
+    )
+    await asyncio.sleep(0)
+    assert client.pending_command_count == 1
+    with pytest.raises(CommandTimeout) as err:
+        await task
+    assert err.value.timeout == 0.05
+    assert client.pending_command_count == 0
+
+
+async def test_command_timeout_full_window(client_session, url, ws_client):
+    """Test that the timeout covers the wait for a slot in a full window."""
+    client = Client(url, client_session, max_commands_in_flight=1)
+    await client.connect()
+    ws_client.send_json.side_effect = None
+
+    message_ids = iter(("1", "2"))
+    with patch(
+        "zwave_js_server.util.message_id.MessageIdGenerator.__call__",
+        side_effect=lambda: next(message_ids),
+    ):
+        task = asyncio.create_task(client.async_send_command({"command": "node.ping"}))
+        await asyncio.sleep(0)
+        assert client.command_queue_stats.in_flight == 1
+        ws_client.send_json.reset_mock()
+
+        with pytest.raises(CommandTimeout) as err:
+            await client.async_send_command({"command": "node.ping"}, timeout=0.01)
+    assert err.value.message_id == "2"
+    ws_client.send_json.assert_not_called()
+    assert client.command_queue_stats.queued[CommandPriority.NORMAL] == 0
+    assert client.command_queue_stats.in_flight == 1
+    assert client.pending_command_count == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert client.command_queue_stats.in_flight == 0
+
+
+async def test_cancelled_command(client_session, url, ws_client):
+    """Test that a cancelled command removes its result future."""
+    client = Client(url, client_session)
+    await client.connect()
+    ws_client.send_json.side_effect = None
+
+    task = asyncio.create_task(client.async_send_command({"command": "node.ping"}))
+    await asyncio.sleep(0)
+    assert client.pending_command_count == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert client.pending_command_count == 0
+
+
+async def test_message_id_factory(client_session, url, ws_client):
+    """Test that a custom message ID factory is used for commands."""
+    message_ids = iter(("first", "second"))
+    client = Client(url, client_session, message_id_factory=lambda: next(message_ids))
+    await client.connect()
+    ws_client.send_json.side_effect = None
+
+    await client.async_send_command_no_wait({"command": "node.ping"})
+    assert ws_client.send_json.call_args.args[0]["messageId"] == "first"
+    await client.async_send_command_no_wait({"command": "node.ping"})
+    assert ws_client.send_json.call_args.args[0]["messageId"] == "second"
+
+
+async def test_record_messages_journal(
+    client, wallmote_central_scene, mock_command, uuid4, tmp_path
+):
+    """Test recording messages to a journal."""
+    # pylint: disable=protected-access
+    journal = MessageJournal(tmp_path / "journal.jsonl")
+    client.begin_recording_messages(journal)
+    mock_command(
+        {"command": "some_command"},
+        {},
+    )
+    mock_command(
+        {"command": "some_other_command"},
+        {},
+    )
+
+    await client.async_send_command({"command": "some_command"})
+    await client.async_send_command_no_wait({"command": "some_other_command"})
+
+    client._handle_incoming_message(
+        {
+            "type": "event",
+            "event": {
+                "source": "node",
+                "event": "value updated",
+                "nodeId": wallmote_central_scene.node_id,
+                "args": {
+                    "commandClassName": "Binary Switch",
+                    "commandClass": 39,
+                    "endpoint": 0,
+                    "property": "currentValue",
+                    "newValue": False,
+                    "prevValue": True,
+                    "propertyName": "currentValue",
+                },
+            },
+        }
+    )
+    # Complete records are not kept in memory
+    assert not client._recorded_commands
+    assert not client._recorded_events
+    assert journal.record_count == 3
+
+    assert client.end_recording_messages() == []
+    assert journal.closed
+    assert not client.recording_messages
+    await asyncio.get_running_loop().run_in_executor(None, journal.join)
+
+    records = list(read_journal(journal.path))
+    assert [record["record_type"] for record in records] == [
+        "command",
+        "command",
+        "event",
+    ]
+    assert records[0]["command_msg"] == {
+        "command": "some_command",
+        "messageId": uuid4,
+    }
+    assert records[0]["result_msg"] == {
+        "messageId": "1234",
+        "result": {},
+        "success": True,
+        "type": "result",
+    }
+    assert "result_ts" in records[0]
+    assert records[1]["command"] == "some_other_command"
+    assert "result_msg" not in records[1]
+    assert records[2]["type"] == "value updated"
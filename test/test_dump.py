@@ -6,6 +6,7 @@ import pytest
 
 from zwave_js_server.const import __version__
 from zwave_js_server.dump import dump_msgs
+from zwave_js_server.util.json import DEFAULT_CODEC
 
 from .common import update_ws_client_msg_queue
 
@@ -47,7 +48,8 @@ async def test_dump(
     assert ws_client.receive_json.call_count == 3
     assert ws_client.send_json.call_count == 2
     assert ws_client.send_json.call_args == call(
-        {"command": "start_listening", "messageId": "start-listening"}
+        {"command": "start_listening", "messageId": "start-listening"},
+        dumps=DEFAULT_CODEC.dumps,
     )
     assert ws_client.close.call_count == 1
     assert messages
@@ -75,7 +77,8 @@ async def test_dump_timeout(
     assert ws_client.receive_json.call_count == 5
     assert ws_client.send_json.call_count == 2
     assert ws_client.send_json.call_args == call(
-        {"command": "start_listening", "messageId": "start-listening"}
+        {"command": "start_listening", "messageId": "start-listening"},
+        dumps=DEFAULT_CODEC.dumps,
     )
     assert ws_client.close.call_count == 1
     assert messages
@@ -111,7 +114,8 @@ async def test_dump_additional_user_agent_components(
                 "zwave-js-server-python": __version__,
                 "foo": "bar",
             },
-        }
+        },
+        dumps=DEFAULT_CODEC.dumps,
     )
     assert ws_client.close.call_count == 1
     assert messages
@@ -1,7 +1,16 @@
 """Test event helpers."""
 
+import logging
+from unittest.mock import Mock, patch
+
+from pydantic import ValidationError
+import pytest
+
 from zwave_js_server import event
 
+VALID_EVENT = {"source": "node", "event": "test"}
+INVALID_EVENT = {"source": "invalid", "event": "test"}
+
 
 def test_once():
     """Test once listens to event once."""
@@ -13,9 +22,127 @@ def test_once():
     assert len(calls) == 1
 
 
+def test_unsubscribe():
+    """Test unsubscribing listeners through their handles."""
+    mock = event.EventBase()
+    calls = []
+    unsub_1 = mock.on("test-event", calls.append)
+    unsub_2 = mock.on("test-event", calls.append)
+    assert isinstance(unsub_1, event.ListenerHandle)
+    mock.emit("test-event", 1)
+    assert calls == [1, 1]
+
+    # Each handle only removes its own listener, also for the same callback
+    unsub_1()
+    unsub_1()
+    mock.emit("test-event", 2)
+    assert calls == [1, 1, 2]
+
+    unsub_2.unsubscribe()
+    mock.emit("test-event", 3)
+    assert calls == [1, 1, 2]
+
+
+def test_subscribe_during_emit():
+    """Test that listener changes during an emit apply to the next emit."""
+    mock = event.EventBase()
+    calls = []
+    unsubs = []
+
+    def listener(data):
+        calls.append(("first", data))
+        # Remove the second listener and add a third one
+        unsubs.pop()()
+        mock.on("test-event", lambda data: calls.append(("third", data)))
+
+    mock.on("test-event", listener)
+    unsubs.append(mock.on("test-event", lambda data: calls.append(("second", data))))
+    mock.emit("test-event", 1)
+    assert calls == [("first", 1), ("second", 1)]
+
+    calls.clear()
+    unsubs.append(lambda: None)
+    mock.emit("test-event", 2)
+    assert calls == [("first", 2), ("third", 2)]
+
+
 def test_exception_on_emit(caplog):
     """Test exception on emit gets handled."""
     mock = event.EventBase()
     mock.on("test-event", lambda _: 1 / 0)
     mock.emit("test-event", 1)
     assert "Error handling event: test-event" in caplog.text
+
+
+def test_event_validator_strict(caplog):
+    """Test that strict event validation validates and raises on every event."""
+    validator = event.EventValidator()
+    assert validator.mode == event.EventValidationMode.STRICT
+    validator.validate(event.BaseEventModel, VALID_EVENT)
+    with pytest.raises(ValidationError):
+        validator.validate(event.BaseEventModel, INVALID_EVENT)
+    with pytest.raises(KeyError):
+        validator.validate(event.BaseEventModel, {"source": "node"})
+    assert validator.stats == event.EventValidationStats(
+        validated=3, skipped=0, failures=2
+    )
+
+
+def test_event_validator_sampled(caplog):
+    """Test that sampled event validation validates one in every N events."""
+    validator = event.EventValidator("sampled", sample_rate=3)
+    for _ in range(6):
+        validator.validate(event.BaseEventModel, INVALID_EVENT)
+    assert validator.stats == event.EventValidationStats(
+        validated=2, skipped=4, failures=2
+    )
+    assert "Received invalid test event" in caplog.text
+
+
+def test_event_validator_off():
+    """Test that event validation can be turned off."""
+    validator = event.EventValidator(event.EventValidationMode.OFF)
+    validator.validate(event.BaseEventModel, INVALID_EVENT)
+    assert validator.stats == event.EventValidationStats(
+        validated=0, skipped=1, failures=0
+    )
+
+    with pytest.raises(ValueError):
+        event.EventValidator(event.EventValidationMode.SAMPLED, sample_rate=0)
+
+
+def test_event_handler_dispatch(caplog):
+    """Test that events are dispatched to the handler of the event type."""
+    caplog.set_level(logging.DEBUG)
+
+    class Model(event.EventBase):
+        """Represent a model with event handlers."""
+
+        def __init__(self) -> None:
+            """Initialize the model."""
+            super().__init__()
+            self.events: list[event.Event] = []
+
+        def handle_test_event(self, evt: event.Event) -> None:
+            """Process a test event."""
+            self.events.append(evt)
+
+    # pylint: disable-next=protected-access
+    assert Model._event_handlers == {"test event": Model.handle_test_event}
+    model = Model()
+    test_event = event.Event("test event")
+    model._handle_event_protocol(test_event)  # pylint: disable=protected-access
+    assert model.events == [test_event]
+
+    # pylint: disable-next=protected-access
+    model._handle_event_protocol(event.Event("unknown event"))
+    assert model.events == [test_event]
+    assert "Received unknown event" in caplog.text
+
+    # Handlers replaced on the class are used for dispatch
+    handler = Mock()
+    with patch.object(Model, "handle_test_event", handler):
+        model._handle_event_protocol(test_event)  # pylint: disable=protected-access
+    handler.assert_called_once_with(model, test_event)
+    model._handle_event_protocol(test_event)  # pylint: disable=protected-access
+    assert model.events == [test_event, test_event]
@@ -0,0 +1,141 @@
+"""Test the command window."""
+
+import asyncio
+
+import pytest
+
+from zwave_js_server.const import CommandPriority
+from zwave_js_server.util.command_window import (
+    CommandQueueStats,
+    CommandWindow,
+    get_command_priority,
+)
+
+
+def test_get_command_priority():
+    """Test the default priority of commands."""
+    assert get_command_priority("node.set_value") == CommandPriority.HIGH
+    assert get_command_priority("node.poll_value") == CommandPriority.LOW
+    assert get_command_priority("node.ping") == CommandPriority.NORMAL
+
+
+async def test_unlimited():
+    """Test that an unlimited window never waits."""
+    window = CommandWindow()
+    for _ in range(10):
+        await window.acquire()
+    assert window.stats == CommandQueueStats(
+        limit=None,
+        in_flight=10,
+        queued={
+            CommandPriority.HIGH: 0,
+            CommandPriority.NORMAL: 0,
+            CommandPriority.LOW: 0,
+        },
+    )
+
+
+async def test_priority_order():
+    """Test that free slots go to the highest priority command first."""
+    window = CommandWindow(1)
+    started = []
+
+    async def command(name, priority):
+        await window.acquire(priority)
+        started.append(name)
+
+    await window.acquire()
+    tasks = [
+        asyncio.create_task(command(name, priority))
+        for name, priority in (
+            ("poll 1", CommandPriority.LOW),
+            ("ping", CommandPriority.NORMAL),
+            ("poll 2", CommandPriority.LOW),
+            ("set", CommandPriority.HIGH),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert window.stats.in_flight == 1
+    assert window.stats.queued == {
+        CommandPriority.HIGH: 1,
+        CommandPriority.NORMAL: 1,
+        CommandPriority.LOW: 2,
+    }
+
+    for _ in tasks:
+        window.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    assert started == ["set", "ping", "poll 1", "poll 2"]
+    assert window.stats.in_flight == 1
+
+    # A new command waits for the queued commands of the same or higher priority
+    window.release()
+    await window.acquire(CommandPriority.LOW)
+    assert window.stats.in_flight == 1
+
+
+async def test_reserved_high_priority_slot():
+    """Test that a HIGH priority command gets through a window full of others."""
+    window = CommandWindow(3)
+    assert window.shared_limit == 2
+    await window.acquire(CommandPriority.LOW)
+    await window.acquire(CommandPriority.LOW)
+    waiting_tasks = [
+        asyncio.create_task(window.acquire(priority))
+        for priority in (CommandPriority.LOW, CommandPriority.NORMAL)
+    ]
+    await asyncio.sleep(0)
+    assert window.stats.in_flight == 2
+    assert window.stats.queued[CommandPriority.LOW] == 1
+    assert window.stats.queued[CommandPriority.NORMAL] == 1
+
+    # The reserved slot is only used by HIGH priority commands
+    await window.acquire(CommandPriority.HIGH)
+    assert window.stats.in_flight == 3
+    window.release()
+    await asyncio.sleep(0)
+    assert window.stats.in_flight == 2
+    assert not any(task.done() for task in waiting_tasks)
+
+    # A free shared slot goes to the waiting command with the highest priority
+    window.release()
+    await asyncio.sleep(0)
+    assert waiting_tasks[1].done()
+    assert not waiting_tasks[0].done()
+    window.release()
+    await asyncio.gather(*waiting_tasks)
+    assert window.stats.in_flight == 2
+
+    # A window of one slot doesn't reserve it
+    assert CommandWindow(1).shared_limit == 1
+    assert CommandWindow(3, reserved_high=0).shared_limit == 3
+    assert CommandWindow().shared_limit is None
+    with pytest.raises(ValueError):
+        CommandWindow(3, reserved_high=-1)
+
+
+async def test_cancel_waiting_command():
+    """Test that a cancelled command leaves the queue."""
+    window = CommandWindow(1)
+    await window.acquire()
+    task = asyncio.create_task(window.acquire())
+    await asyncio.sleep(0)
+    assert window.stats.queued[CommandPriority.NORMAL] == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert window.stats.queued[CommandPriority.NORMAL] == 0
+
+    # The slot is handed over but the command is cancelled before it runs
+    task = asyncio.create_task(window.acquire())
+    await asyncio.sleep(0)
+    window.release()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert window.stats.in_flight == 0
+
+    with pytest.raises(ValueError):
+        CommandWindow(0)
@@ -0,0 +1,45 @@
+"""Test the message journal."""
+
+import pytest
+
+from zwave_js_server.util.journal import MessageJournal, read_journal
+
+
+def test_journal(tmp_path):
+    """Test writing and reading a journal."""
+    path = tmp_path / "journal.jsonl"
+    journal = MessageJournal(path)
+    assert not journal.closed
+    journal.write({"record_type": "event", "event_msg": {"a": 1}})
+    journal.write({"record_type": "command", "command_msg": {"b": [1, 2]}})
+    assert journal.record_count == 2
+    journal.close()
+    assert journal.closed
+    with pytest.raises(ValueError):
+        journal.write({"record_type": "event", "event_msg": {}})
+    journal.join()
+
+    assert list(read_journal(path)) == [
+        {"record_type": "event", "event_msg": {"a": 1}},
+        {"record_type": "command", "command_msg": {"b": [1, 2]}},
+    ]
+
+    # Journals are appended to
+    journal = MessageJournal(path)
+    journal.write({"record_type": "event", "event_msg": {"c": None}})
+    journal.close()
+    journal.join()
+    assert len(list(read_journal(path))) == 3
+
+
+def test_journal_encodes_on_write(tmp_path):
+    """Test that records are encoded when written, not when the file is."""
+    path = tmp_path / "journal.jsonl"
+    journal = MessageJournal(path)
+    record = {"record_type": "event", "event_msg": {"a": 1}}
+    journal.write(record)
+    record["event_msg"]["a"] = 2
+    journal.close()
+    journal.join()
+    assert not journal._writer.is_alive()  # pylint: disable=protected-access
+    assert list(read_journal(path)) == [{"record_type": "event", "event_msg": {"a": 1}}]
@@ -0,0 +1,98 @@
+"""Test the JSON codec helpers."""
+
+from enum import IntEnum
+
+import pytest
+
+from zwave_js_server.util import json as json_util
+from zwave_js_server.util.json import (
+    DEFAULT_CODEC,
+    STDLIB_CODEC,
+    ParseBucketStats,
+    ParseOffloadPolicy,
+    get_default_codec,
+    timed_parse,
+)
+
+
+class _TestEnum(IntEnum):
+    """Test enum."""
+
+    ONE = 1
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        STDLIB_CODEC,
+        json_util._get_orjson_codec(),  # pylint: disable=protected-access
+        json_util._get_msgspec_codec(),  # pylint: disable=protected-access
+    ],
+)
+def test_codec_round_trip(codec):
+    """Test that a codec can round trip a message."""
+    if codec is None:
+        pytest.skip("JSON library not installed")
+
+    message = {
+        "command": "node.set_value",
+        "messageId": "1234",
+        "nodeId": 2,
+        "valueId": {"commandClass": _TestEnum.ONE, "property": "targetValue"},
+        "value": [1.5, None, True, "ü"],
+    }
+    encoded = codec.dumps(message)
+    assert isinstance(encoded, str)
+    decoded = codec.loads(encoded)
+    assert decoded["valueId"]["commandClass"] == 1
+    assert decoded["value"] == [1.5, None, True, "ü"]
+    assert codec.loads(encoded.encode()) == decoded
+
+    with pytest.raises(ValueError):
+        codec.loads("{invalid")
+
+
+def test_default_codec(monkeypatch):
+    """Test the default codec selection."""
+    assert DEFAULT_CODEC.name in ("orjson", "msgspec", "json")
+    monkeypatch.setattr(json_util, "orjson", None)
+    monkeypatch.setattr(json_util, "msgspec", None)
+    assert get_default_codec() is STDLIB_CODEC
+
+
+def test_parse_offload_policy():
+    """Test that the parse offload threshold follows measured parse times."""
+    policy = ParseOffloadPolicy(8192, max_inline_parse_time=0.001)
+    assert not policy.should_offload(8192)
+    assert policy.should_offload(8193)
+
+    # Mid-sized messages parse quickly, so they no longer need an executor
+    policy.record(20000, 0.0001)
+    assert policy.threshold == 32767
+    assert not policy.should_offload(20000)
+
+    # Big messages are slow, so the threshold moves down below them
+    policy.record(3_000_000, 0.05)
+    assert policy.threshold == 32767
+    policy.record(30000, 0.01)
+    assert policy.threshold == 16383
+    assert policy.should_offload(30000)
+
+    # A fast sample above a slow bucket doesn't move the threshold past it
+    policy.record(60000, 0.0001)
+    assert policy.threshold == 16383
+
+    assert policy.stats == [
+        ParseBucketStats(
+            max_size=32767, count=2, avg_parse_time=pytest.approx(0.00208)
+        ),
+        ParseBucketStats(max_size=65535, count=1, avg_parse_time=0.0001),
+        ParseBucketStats(max_size=4194303, count=1, avg_parse_time=0.05),
+    ]
+
+
+def test_timed_parse():
+    """Test timed parse."""
+    data, parse_time = timed_parse(lambda: {"a": 1})
+    assert data == {"a": 1}
+    assert parse_time >= 0
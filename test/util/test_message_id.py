@@ -0,0 +1,25 @@
+"""Test the message ID generators."""
+
+from zwave_js_server.util.message_id import MessageIdGenerator, uuid_message_id
+
+
+def test_message_id_generator():
+    """Test that message IDs are counted up after the nonce."""
+    generator = MessageIdGenerator()
+    assert len(generator.nonce) == 8
+    assert [generator() for _ in range(3)] == [
+        f"{generator.nonce}-1",
+        f"{generator.nonce}-2",
+        f"{generator.nonce}-3",
+    ]
+
+    # Every generator has its own nonce and counter
+    other_generator = MessageIdGenerator()
+    assert other_generator.nonce != generator.nonce
+    assert other_generator() == f"{other_generator.nonce}-1"
+
+
+def test_uuid_message_id():
+    """Test UUID message IDs."""
+    assert len(uuid_message_id()) == 32
+    assert uuid_message_id() != uuid_message_id()
@@ -1,9 +1,16 @@
 """Test node utility functions."""
 
+import asyncio
+from itertools import count
+
+import pytest
+
 from zwave_js_server.client import Client
 from zwave_js_server.const import CommandClass, SetValueStatus
+from zwave_js_server.exceptions import FailedCommand, NotFoundError, UnwriteableValue
 from zwave_js_server.model.node import Node
 from zwave_js_server.util.multicast import (
+    ValueWrite,
     _async_send_command,
     async_multicast_endpoint_get_cc_version,
     async_multicast_endpoint_invoke_cc_api,
@@ -11,6 +18,8 @@ from zwave_js_server.util.multicast import (
     async_multicast_endpoint_supports_cc_api,
     async_multicast_get_endpoint_count,
     async_multicast_set_value,
+    async_multicast_set_values,
+    plan_multicast_set_values,
 )
 
 from ..common import MockCommandProtocol
@@ -368,3 +377,231 @@ async def test_set_value_broadcast_missing_value(
         "options": None,
         "messageId": uuid4,
     }
+
+
+async def test_plan_multicast_set_values(
+    climate_radio_thermostat_ct100_plus, inovelli_switch
+):
+    """Test grouping writes into set_value commands."""
+    node1 = climate_radio_thermostat_ct100_plus
+    node2 = inovelli_switch
+    writes = [
+        ValueWrite(node1, "13-112-0-1", 1),
+        ValueWrite(node2, node2.values["31-112-0-1"], 1),
+        ValueWrite(node2, "31-112-0-1", 2),
+        ValueWrite(node1, "13-112-0-3", 1),
+        ValueWrite(node2, "31-112-0-1", 1),
+        ValueWrite(node1, "13-112-0-1", True),
+    ]
+    groups = plan_multicast_set_values(writes)
+
+    assert [
+        (group.value_data["property"], group.new_value, group.nodes) for group in groups
+    ] == [
+        (1, 1, [node1, node2]),
+        (1, 2, [node2]),
+        (3, 1, [node1]),
+        (1, 1, [node2]),
+        (1, True, [node1]),
+    ]
+    assert [group.write_indexes for group in groups] == [[0, 1], [2], [3], [4], [5]]
+
+    with pytest.raises(UnwriteableValue):
+        plan_multicast_set_values([ValueWrite(node1, "13-112-0-2", 1)])
+
+    with pytest.raises(NotFoundError):
+        plan_multicast_set_values([ValueWrite(node1, "13-112-0-255", 1)])
+
+
+async def test_multicast_set_values(
+    climate_radio_thermostat_ct100_plus,
+    inovelli_switch,
+    multisensor_6,
+    client,
+    uuid4,
+    mock_command,
+):
+    """Test setting values on many nodes with multicast and node commands."""
+    node1 = climate_radio_thermostat_ct100_plus
+    node2 = inovelli_switch
+    ack_commands = mock_command(
+        {"command": "multicast_group.set_value"},
+        {"result": {"status": 255}},
+    )
+    mock_command(
+        {"command": "node.set_value"},
+        {"result": {"status": 1}},
+    )
+
+    results = await async_multicast_set_values(
+        client,
+        [
+            ValueWrite(node1, "13-112-0-1", 1),
+            ValueWrite(node2, "31-112-0-3", 5),
+            ValueWrite(node2, "31-112-0-1", 1),
+        ],
+    )
+    assert [result.status for result in results] == [
+        SetValueStatus.SUCCESS,
+        SetValueStatus.WORKING,
+        SetValueStatus.SUCCESS,
+    ]
+
+    assert ack_commands == [
+        {
+            "command": "multicast_group.set_value",
+            "nodeIDs": [node1.node_id, node2.node_id],
+            "value": 1,
+            "valueId": {"commandClass": 112, "endpoint": 0, "property": 1},
+            "options": None,
+            "messageId": uuid4,
+        },
+        {
+            "command": "node.set_value",
+            "nodeId": node2.node_id,
+            "valueId": {"commandClass": 112, "endpoint": 0, "property": 3},
+            "value": 5,
+            "messageId": uuid4,
+        },
+    ]
+
+
+async def test_multicast_set_values_broadcast(
+    climate_radio_thermostat_ct100_plus, inovelli_switch, client, uuid4, mock_command
+):
+    """Test setting values on all nodes with a broadcast command."""
+    node1 = climate_radio_thermostat_ct100_plus
+    node2 = inovelli_switch
+    ack_commands = mock_command(
+        {"command": "broadcast_node.set_value"},
+        {"result": {"status": 255}},
+    )
+
+    results = await async_multicast_set_values(
+        client,
+        [ValueWrite(node1, "13-112-0-1", 1), ValueWrite(node2, "31-112-0-1", 1)],
+        {"volume": 50},
+    )
+    assert [result.status for result in results] == [SetValueStatus.SUCCESS] * 2
+
+    assert ack_commands == [
+        {
+            "command": "broadcast_node.set_value",
+            "value": 1,
+            "valueId": {"commandClass": 112, "endpoint": 0, "property": 1},
+            "options": {"volume": 50},
+            "messageId": uuid4,
+        }
+    ]
+
+
+async def test_multicast_set_values_write_order(
+    climate_radio_thermostat_ct100_plus,
+    inovelli_switch,
+    multisensor_6,
+    client,
+    ws_client,
+):
+    """Test that writes to the same value are sent in the order of the writes."""
+    # pylint: disable=protected-access
+    node1 = climate_radio_thermostat_ct100_plus
+    node2 = inovelli_switch
+    message_ids = (str(idx) for idx in count())
+    client._next_message_id = lambda: next(message_ids)
+    sent_commands: list[dict] = []
+    ws_client.send_json.side_effect = lambda message, **kwargs: sent_commands.append(
+        message
+    )
+
+    def send_result(command: dict) -> None:
+        """Send the result of a command."""
+        client._handle_incoming_message(
+            {
+                "type": "result",
+                "messageId": command["messageId"],
+                "success": True,
+                "result": {"result": {"status": 255}},
+            }
+        )
+
+    task = asyncio.create_task(
+        async_multicast_set_values(
+            client,
+            [
+                ValueWrite(node1, "13-112-0-1", 1),
+                ValueWrite(node2, "31-112-0-1", 1),
+                ValueWrite(node2, "31-112-0-1", 2),
+                ValueWrite(node1, "13-112-0-3", 5),
+            ],
+        )
+    )
+    for _ in range(20):
+        await asyncio.sleep(0)
+    # The second write to the value of node2 waits for the result of the first
+    assert [(command["command"], command["value"]) for command in sent_commands] == [
+        ("multicast_group.set_value", 1),
+        ("node.set_value", 5),
+    ]
+
+    send_result(sent_commands[0])
+    send_result(sent_commands[1])
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert len(sent_commands) == 3
+    assert sent_commands[2]["command"] == "node.set_value"
+    assert sent_commands[2]["nodeId"] == node2.node_id
+    assert sent_commands[2]["value"] == 2
+
+    send_result(sent_commands[2])
+    results = await task
+    assert [result.status for result in results] == [SetValueStatus.SUCCESS] * 4
+
+
+async def test_multicast_set_values_failed_group(
+    climate_radio_thermostat_ct100_plus,
+    inovelli_switch,
+    multisensor_6,
+    client,
+    ws_client,
+):
+    """Test that a failed command doesn't stop the commands of the other writes."""
+    # pylint: disable=protected-access
+    node1 = climate_radio_thermostat_ct100_plus
+    node2 = inovelli_switch
+    message_ids = (str(idx) for idx in count())
+    client._next_message_id = lambda: next(message_ids)
+    sent_commands: list[dict] = []
+
+    def send_json(message: dict, **kwargs) -> None:
+        """Fail the multicast command and succeed the node commands."""
+        sent_commands.append(message)
+        if message["command"] == "multicast_group.set_value":
+            result = {"success": False, "errorCode": "unknown_command", "message": ""}
+        else:
+            result = {"success": True, "result": {"result": {"status": 255}}}
+        asyncio.get_running_loop().call_soon(
+            client._handle_incoming_message,
+            {"type": "result", "messageId": message["messageId"], **result},
+        )
+
+    ws_client.send_json.side_effect = send_json
+
+    results = await async_multicast_set_values(
+        client,
+        [
+            ValueWrite(node1, "13-112-0-1", 1),
+            ValueWrite(node2, "31-112-0-1", 1),
+            ValueWrite(node2, "31-112-0-1", 2),
+            ValueWrite(node1, "13-112-0-3", 5),
+        ],
+    )
+    # The write that waited for the failed command was still sent
+    assert [(command["command"], command["value"]) for command in sent_commands] == [
+        ("multicast_group.set_value", 1),
+        ("node.set_value", 5),
+        ("node.set_value", 2),
+    ]
+    assert isinstance(results[0], FailedCommand)
+    assert results[0].error_code == "unknown_command"
+    assert results[1] is results[0]
+    assert [result.status for result in results[2:]] == [SetValueStatus.SUCCESS] * 2
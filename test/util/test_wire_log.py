@@ -0,0 +1,64 @@
+"""Test the wire logger."""
+
+import json
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from zwave_js_server.util.wire_log import WireLogger, WirePayload
+
+LOGGER = logging.getLogger("zwave_js_server.test")
+
+
+def test_wire_payload():
+    """Test that payloads are truncated when formatted."""
+    assert str(WirePayload('{"a": 1}', 10, json.dumps)) == '{"a": 1}'
+    assert str(WirePayload({"a": 1}, 10, json.dumps)) == '{"a": 1}'
+    assert (
+        str(WirePayload({"a": "0123456789"}, 10, json.dumps))
+        == '{"a": "012... (9 more characters)'
+    )
+
+
+def test_wire_payload_lazy(caplog):
+    """Test that payloads are only encoded when the log record is formatted."""
+    dumps = Mock(return_value="{}")
+    wire_logger = WireLogger(LOGGER, dumps)
+    with caplog.at_level(logging.INFO, LOGGER.name):
+        wire_logger.log_sent({})
+    dumps.assert_not_called()
+
+    with caplog.at_level(logging.DEBUG, LOGGER.name):
+        wire_logger.log_sent({})
+    assert caplog.records[-1].getMessage() == "Publishing message: {}"
+    dumps.assert_called_once_with({})
+
+
+def test_sampled_events(caplog):
+    """Test that only one in every sample rate high rate events is logged."""
+    wire_logger = WireLogger(LOGGER, json.dumps, event_sample_rate=3)
+    value_updated = {"type": "event", "event": {"event": "value updated"}}
+    node_dead = {"type": "event", "event": {"event": "dead"}}
+    with caplog.at_level(logging.DEBUG, LOGGER.name):
+        for _ in range(5):
+            wire_logger.log_received(json.dumps(value_updated), value_updated)
+            wire_logger.log_received(json.dumps(node_dead), node_dead)
+        wire_logger.log_received('{"type": "result"}', {"type": "result"})
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 8
+    assert (
+        messages.count(
+            f"Received message (1 in 3 value updated events): {json.dumps(value_updated)}"
+        )
+        == 2
+    )
+    assert messages.count(f"Received message: {json.dumps(node_dead)}") == 5
+    assert messages[-1] == 'Received message: {"type": "result"}'
+
+
+def test_invalid_event_sample_rate():
+    """Test that the event sample rate must be positive."""
+    with pytest.raises(ValueError):
+        WireLogger(LOGGER, json.dumps, event_sample_rate=0)
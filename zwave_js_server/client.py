@@ -5,14 +5,15 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
+from functools import partial
 import logging
 from operator import itemgetter
-import pprint
+import os
 from types import TracebackType
 from typing import Any, cast
-import uuid
 
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType, client_exceptions
 
@@ -21,12 +22,14 @@ from .const import (
     MAX_SERVER_SCHEMA_VERSION,
     MIN_SERVER_SCHEMA_VERSION,
     PACKAGE_NAME,
+    CommandPriority,
     LogLevel,
     __version__,
 )
-from .event import Event
+from .event import Event, EventValidationMode, EventValidationStats, EventValidator
 from .exceptions import (
     CannotConnect,
+    CommandTimeout,
     ConnectionClosed,
     ConnectionFailed,
     FailedCommand,
@@ -36,10 +39,26 @@ from .exceptions import (
     InvalidState,
     NotConnected,
 )
+from .model.device_config import DeviceConfigCache
 from .model.driver import Driver
+from .model.log_config import LogConfigDataType
 from .model.log_message import LogMessage
+from .model.value import MetadataPool
 from .model.version import VersionInfo, VersionInfoDataType
+from .util.command_window import CommandQueueStats, CommandWindow, get_command_priority
+from .util.journal import MessageJournal
+from .util.json import (
+    DEFAULT_CODEC,
+    JSONCodec,
+    ParseBucketStats,
+    ParseOffloadPolicy,
+    timed_parse,
+)
+from .util.message_id import MessageIdGenerator
+from .util.wire_log import WireLogger
 
+# Initial size above which received messages are parsed in the parse executor,
+# the client adapts it to the measured parse times
 SIZE_PARSE_JSON_EXECUTOR = 8192
 
 # Message IDs
@@ -57,21 +76,50 @@ LOGGER = logging.getLogger(__package__)
 SERVER_LOGGER = logging.getLogger(f"{__package__}.server")
 
 
-class Client:
+class Client:  # pylint: disable=too-many-instance-attributes
     """Class to manage the IoT connection."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         ws_server_url: str,
         aiohttp_session: ClientSession,
         schema_version: int = MAX_SERVER_SCHEMA_VERSION,
         additional_user_agent_components: dict[str, str] | None = None,
         record_messages: bool = False,
+        json_codec: JSONCodec | None = None,
+        *,
+        event_validation: EventValidationMode = EventValidationMode.STRICT,
+        event_validation_sample_rate: int = 100,
+        resync_on_reconnect: bool = False,
+        max_commands_in_flight: int | None = None,
+        command_timeout: float | None = None,
+        message_id_factory: Callable[[], str] | None = None,
+        device_lookup_cache_path: str | os.PathLike[str] | None = None,
     ):
         """Initialize the Client class."""
         self.ws_server_url = ws_server_url
         self.aiohttp_session = aiohttp_session
+        # JSON codec used to decode received and encode sent messages
+        self.json_codec = json_codec or DEFAULT_CODEC
+        self._parse_policy = ParseOffloadPolicy(SIZE_PARSE_JSON_EXECUTOR)
+        # Logs sent and received messages when debug logging is enabled
+        self.wire_logger = WireLogger(LOGGER, self.json_codec.dumps)
+        self._parse_executor: ThreadPoolExecutor | None = None
+        # Validates incoming events, one in every event_validation_sample_rate
+        # events is validated in sampled mode
+        self.event_validator = EventValidator(
+            event_validation, event_validation_sample_rate
+        )
         self.driver: Driver | None = None
+        # Shares equal value metadata between the values of the driver's nodes
+        self.metadata_pool = MetadataPool()
+        # Shares equal device configs between the driver's nodes
+        self.device_config_cache = DeviceConfigCache()
+        # File in which the config manager of the driver caches device lookups
+        self.device_lookup_cache_path = device_lookup_cache_path
+        # Keep the driver when the connection is lost and resync it with the state
+        # dump after reconnecting, instead of requiring a new driver
+        self._resync_on_reconnect = resync_on_reconnect
         # The WebSocket client
         self._client: ClientWebSocketResponse | None = None
         # Version of the connected server
@@ -83,6 +131,17 @@ class Client:
         }
         self._loop = asyncio.get_running_loop()
         self._result_futures: dict[str, asyncio.Future] = {}
+        # Generates the message IDs of commands, by default from a counter with a
+        # nonce that is renewed for every connection
+        self._message_id_factory = message_id_factory
+        self._next_message_id: Callable[[], str] = (
+            message_id_factory or MessageIdGenerator()
+        )
+        # Default time in seconds to wait for the result of a command, None waits
+        # until the connection is closed
+        self.command_timeout = command_timeout
+        # Limits the number of commands waiting for a result, unlimited by default
+        self._command_window = CommandWindow(max_commands_in_flight)
         self._shutdown_complete_event: asyncio.Event | None = None
 
         self._server_logger_unsubs: list[Callable[[], None]] = []
@@ -91,6 +150,8 @@ class Client:
         self._record_messages = record_messages
         self._recorded_commands: defaultdict[str, dict] = defaultdict(dict)
         self._recorded_events: list[dict] = []
+        # Journal that records are written to instead of keeping them in memory
+        self._journal: MessageJournal | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -110,10 +171,49 @@ class Client:
         """Return True if messages are being recorded."""
         return self._record_messages
 
+    @property
+    def parse_executor_threshold(self) -> int:
+        """Return the size above which messages are parsed off the event loop."""
+        return self._parse_policy.threshold
+
+    @property
+    def parse_stats(self) -> list[ParseBucketStats]:
+        """Return the measured parse times per message size bucket."""
+        return self._parse_policy.stats
+
+    @property
+    def event_validation_stats(self) -> EventValidationStats:
+        """Return the event validation counters."""
+        return self.event_validator.stats
+
+    @property
+    def pending_command_count(self) -> int:
+        """Return the number of commands waiting for a result."""
+        return len(self._result_futures)
+
+    @property
+    def command_queue_stats(self) -> CommandQueueStats:
+        """Return the number of commands in flight and waiting to be sent."""
+        return self._command_window.stats
+
     async def async_send_command(
-        self, message: dict[str, Any], require_schema: int | None = None
+        self,
+        message: dict[str, Any],
+        require_schema: int | None = None,
+        priority: CommandPriority | None = None,
+        timeout: float | None = None,
     ) -> dict:
-        """Send a command and get a response."""
+        """Send a command and get a response.
+
+        When max_commands_in_flight commands are waiting for a result, the command
+        waits until a slot is free. Slots go to the command with the highest
+        priority first, which defaults to the priority of the command type. When
+        the limit is more than one, one slot is reserved for HIGH priority commands.
+
+        Raises CommandTimeout when no result is received within timeout seconds,
+        which defaults to command_timeout of the client. The time spent waiting
+        for a slot counts towards the timeout.
+        """
         if require_schema is not None and require_schema > self.schema_version:
             assert self.version
             raise InvalidServerVersion(
@@ -123,19 +223,38 @@ class Client:
                 "the Z-Wave JS Server to a version that supports at least api schema "
                 f"{require_schema}.",
             )
-        future: asyncio.Future[dict] = self._loop.create_future()
-        message_id = message["messageId"] = uuid.uuid4().hex
-        self._result_futures[message_id] = future
-        await self._send_json_message(message)
+        if priority is None:
+            priority = get_command_priority(message.get("command", ""))
+        if timeout is None:
+            timeout = self.command_timeout
+        message_id = message["messageId"] = self._next_message_id()
         try:
-            return await future
-        finally:
-            self._result_futures.pop(message_id, None)
+            async with asyncio.timeout(timeout):
+                await self._command_window.acquire(priority)
+                try:
+                    future: asyncio.Future[dict] = self._loop.create_future()
+                    self._result_futures[message_id] = future
+                    try:
+                        await self._send_json_message(message)
+                        return await future
+                    finally:
+                        self._result_futures.pop(message_id, None)
+                finally:
+                    self._command_window.release()
+        except TimeoutError as err:
+            raise CommandTimeout(message_id, cast(float, timeout)) from err
 
     async def async_send_command_no_wait(
-        self, message: dict[str, Any], require_schema: int | None = None
+        self,
+        message: dict[str, Any],
+        require_schema: int | None = None,
+        priority: CommandPriority | None = None,
     ) -> None:
-        """Send a command without waiting for the response."""
+        """Send a command without waiting for the response.
+
+        The command waits for its turn like async_send_command, but its slot is
+        freed as soon as the command is sent.
+        """
         if require_schema is not None and require_schema > self.schema_version:
             assert self.version
             raise InvalidServerVersion(
@@ -145,12 +264,18 @@ class Client:
                 "the Z-Wave JS Server to a version that supports at least api schema "
                 f"{require_schema}.",
             )
-        message["messageId"] = uuid.uuid4().hex
-        await self._send_json_message(message)
+        if priority is None:
+            priority = get_command_priority(message.get("command", ""))
+        await self._command_window.acquire(priority)
+        try:
+            message["messageId"] = self._next_message_id()
+            await self._send_json_message(message)
+        finally:
+            self._command_window.release()
 
     async def connect(self) -> None:
         """Connect to the websocket server."""
-        if self.driver is not None:
+        if self.driver is not None and not self._resync_on_reconnect:
             raise InvalidState("Re-connected with existing driver")
 
         LOGGER.debug("Trying to connect")
@@ -167,6 +292,9 @@ class Client:
         ) as err:
             raise CannotConnect(err) from err
 
+        if self._message_id_factory is None:
+            self._next_message_id = MessageIdGenerator()
+
         self.version = version = VersionInfo.from_message(
             cast(VersionInfoDataType, await self._receive_json_or_raise())
         )
@@ -251,30 +379,8 @@ class Client:
                     log_msg["messageId"], log_msg["errorCode"], log_msg["message"]
                 )
 
-            # send start_listening command to the server
-            # we will receive a full state dump and from now on get events
-            await self._send_json_message(
-                {"command": "start_listening", "messageId": START_LISTENING_MESSAGE_ID}
-            )
-
-            state_msg = await self._receive_json_or_raise()
-
-            if not state_msg["success"]:
-                await self._client.close()
-                raise FailedCommand(
-                    state_msg["messageId"], state_msg["errorCode"], state_msg["message"]
-                )
-
-            self.driver = cast(
-                Driver,
-                await self._loop.run_in_executor(
-                    None,
-                    Driver,
-                    self,
-                    state_msg["result"]["state"],
-                    log_msg["result"]["config"],
-                ),
-            )
+            await self._async_start_listening(log_msg["result"]["config"])
+            assert self.driver
 
             driver_ready.set()
 
@@ -296,9 +402,60 @@ class Client:
             if not self._client.closed:
                 await self._client.close()
 
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown(wait=False)
+                self._parse_executor = None
+
             if self._shutdown_complete_event:
                 self._shutdown_complete_event.set()
 
+    async def _async_start_listening(self, log_config: LogConfigDataType) -> None:
+        """Start listening and set up the driver from the received state dump.
+
+        The state dump message is only referenced here, so whatever the driver
+        doesn't keep of it is freed once the driver is set up.
+        """
+        assert self._client
+        # send start_listening command to the server
+        # we will receive a full state dump and from now on get events
+        await self._send_json_message(
+            {"command": "start_listening", "messageId": START_LISTENING_MESSAGE_ID}
+        )
+
+        state_msg = await self._receive_json_or_raise()
+
+        if not state_msg["success"]:
+            await self._client.close()
+            raise FailedCommand(
+                state_msg["messageId"], state_msg["errorCode"], state_msg["message"]
+            )
+
+        await self._async_setup_driver(state_msg["result"]["state"], log_config)
+
+    async def _async_setup_driver(
+        self, state: dict, log_config: LogConfigDataType
+    ) -> None:
+        """Create the driver from a state dump, or resync the existing driver."""
+        assert self._client
+        # The state was just parsed and isn't referenced anywhere else, so the
+        # driver can take ownership of it without copying
+        if self.driver is None:
+            self.metadata_pool.clear()
+            self.device_config_cache.clear()
+            self.driver = cast(
+                Driver,
+                await self._loop.run_in_executor(
+                    None, partial(Driver, self, state, log_config, copy_data=False)
+                ),
+            )
+            return
+
+        if state["controller"].get("homeId") != self.driver.controller.home_id:
+            await self._client.close()
+            raise InvalidState("Re-connected to a different network")
+        # Resyncing emits events, so it has to run in the event loop
+        self.driver.resync(state, log_config, copy_data=False)
+
     async def disconnect(self) -> None:
         """Disconnect the client."""
         LOGGER.debug("Closing client connection")
@@ -332,15 +489,25 @@ class Client:
             {"command": "stop_listening_logs"}, require_schema=31
         )
 
-    def begin_recording_messages(self) -> None:
-        """Begin recording messages for replay later."""
+    def begin_recording_messages(self, journal: MessageJournal | None = None) -> None:
+        """Begin recording messages for replay later.
+
+        When a journal is given, records are written to the journal as soon as they
+        are complete instead of being kept in memory.
+        """
         if self._record_messages:
             raise InvalidState("Already recording messages")
 
+        self._journal = journal
         self._record_messages = True
 
     def end_recording_messages(self) -> list[dict]:
-        """End recording messages and return messages that were recorded."""
+        """End recording messages and return messages that were recorded.
+
+        When recording to a journal, the remaining records are written to the
+        journal, which is closed, and an empty list is returned. The journal file
+        is complete when `MessageJournal.join` returns.
+        """
         if not self._record_messages:
             raise InvalidState("Not recording messages")
 
@@ -353,8 +520,60 @@ class Client:
         self._recorded_commands.clear()
         self._recorded_events.clear()
 
+        if (journal := self._journal) is not None:
+            self._journal = None
+            for record in data:
+                journal.write(record)
+            journal.close()
+            return []
+
         return list(data)
 
+    def _record_command(self, message: dict[str, Any]) -> None:
+        """Record a sent command."""
+        record = {
+            "record_type": "command",
+            "ts": datetime.utcnow().isoformat(),
+            "command": message["command"],
+            "command_msg": message,
+        }
+        if self._journal is not None and message["messageId"] not in (
+            self._result_futures
+        ):
+            # Nobody waits for the result, so the record is already complete
+            self._journal.write(record)
+            return
+        # We don't need to deepcopy command_msg because it is always released by
+        # the caller after the command is sent.
+        self._recorded_commands[message["messageId"]].update(record)
+
+    def _record_result(self, msg: dict) -> None:
+        """Record the result of a command."""
+        result = {"result_ts": datetime.utcnow().isoformat()}
+        if self._journal is not None:
+            # The message is encoded before it is used, so there's no need to copy it
+            if (record := self._recorded_commands.pop(msg["messageId"], None)) is None:
+                # The command was sent before recording began
+                return
+            self._journal.write({**record, **result, "result_msg": msg})
+            return
+        self._recorded_commands[msg["messageId"]].update(
+            {**result, "result_msg": deepcopy(msg)}
+        )
+
+    def _record_event(self, msg: dict) -> None:
+        """Record a received event."""
+        record = {
+            "record_type": "event",
+            "ts": datetime.utcnow().isoformat(),
+            "type": msg["event"]["event"],
+        }
+        if self._journal is not None:
+            # The message is encoded before it is used, so there's no need to copy it
+            self._journal.write({**record, "event_msg": msg})
+            return
+        self._recorded_events.append({**record, "event_msg": deepcopy(msg)})
+
     @property
     def server_logging_enabled(self) -> bool:
         """Return whether server logging is currently enabled."""
@@ -452,20 +671,32 @@ class Client:
         if msg.type != WSMsgType.TEXT:
             raise InvalidMessage(f"Received non-Text message: {msg.type}")
 
+        size = len(msg.data)
+        parse = partial(msg.json, loads=self.json_codec.loads)
         try:
-            if len(msg.data) > SIZE_PARSE_JSON_EXECUTOR:
-                data: dict = await self._loop.run_in_executor(None, msg.json)
+            if self._parse_policy.should_offload(size):
+                if self._parse_executor is None:
+                    # A single dedicated worker keeps large state dumps from
+                    # occupying the shared default executor
+                    self._parse_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="zwave_js_server_parse"
+                    )
+                data, parse_time = await self._loop.run_in_executor(
+                    self._parse_executor, timed_parse, parse
+                )
             else:
-                data = msg.json()
+                data, parse_time = timed_parse(parse)
         except ValueError as err:
             raise InvalidMessage("Received invalid JSON.") from err
 
+        self._parse_policy.record(size, parse_time)
+
         if LOGGER.isEnabledFor(logging.DEBUG) and not (
             self.server_logging_enabled
             and data.get("type") == "event"
             and data.get("event", {}).get("event") == "logging"
         ):
-            LOGGER.debug("Received message:\n%s\n", pprint.pformat(msg))
+            self.wire_logger.log_received(msg.data, data)
 
         return data
 
@@ -482,12 +713,7 @@ class Client:
                 return
 
             if self._record_messages and msg["messageId"] not in LISTEN_MESSAGE_IDS:
-                self._recorded_commands[msg["messageId"]].update(
-                    {
-                        "result_ts": datetime.utcnow().isoformat(),
-                        "result_msg": deepcopy(msg),
-                    }
-                )
+                self._record_result(msg)
 
             if msg["success"]:
                 future.set_result(msg["result"])
@@ -515,14 +741,7 @@ class Client:
         if self._record_messages and not (
             self.server_logging_enabled and msg["event"]["event"] == "logging"
         ):
-            self._recorded_events.append(
-                {
-                    "record_type": "event",
-                    "ts": datetime.utcnow().isoformat(),
-                    "type": msg["event"]["event"],
-                    "event_msg": deepcopy(msg),
-                }
-            )
+            self._record_event(msg)
 
         event = Event(type=msg["event"]["event"], data=msg["event"])
         self.driver.receive_event(event)  # type: ignore
@@ -536,24 +755,15 @@ class Client:
             raise NotConnected
 
         if LOGGER.isEnabledFor(logging.DEBUG):
-            LOGGER.debug("Publishing message:\n%s\n", pprint.pformat(message))
+            self.wire_logger.log_sent(message)
 
         assert self._client
         assert "messageId" in message
 
         if self._record_messages and message["messageId"] not in LISTEN_MESSAGE_IDS:
-            # We don't need to deepcopy command_msg because it is always released by
-            # the caller after the command is sent.
-            self._recorded_commands[message["messageId"]].update(
-                {
-                    "record_type": "command",
-                    "ts": datetime.utcnow().isoformat(),
-                    "command": message["command"],
-                    "command_msg": message,
-                }
-            )
+            self._record_command(message)
 
-        await self._client.send_json(message)
+        await self._client.send_json(message, dumps=self.json_codec.dumps)
 
     async def __aenter__(self) -> Client:
         """Connect to the websocket."""
@@ -37,6 +37,16 @@ class CommandStatus(StrEnum):
     QUEUED = "queued"
 
 
+class CommandPriority(IntEnum):
+    """Priority of a command sent to zwave-js-server, lower values go first."""
+
+    # Interactive commands, e.g. setting a value
+    HIGH = 0
+    NORMAL = 1
+    # Background commands, e.g. polling or refreshing values
+    LOW = 2
+
+
 # Multiple inheritance so that LogLevel will JSON serialize properly
 # Reference: https://stackoverflow.com/a/51976841
 class LogLevel(StrEnum):
@@ -8,6 +8,7 @@ import aiohttp
 
 from .client import INITIALIZE_MESSAGE_ID
 from .const import MAX_SERVER_SCHEMA_VERSION, PACKAGE_NAME, __version__
+from .util.json import DEFAULT_CODEC, JSONCodec
 
 
 async def dump_msgs(
@@ -15,12 +16,14 @@ async def dump_msgs(
     session: aiohttp.ClientSession,
     additional_user_agent_components: dict[str, str] | None = None,
     timeout: float | None = None,
+    json_codec: JSONCodec | None = None,
 ) -> list[dict]:
     """Dump server state."""
+    codec = json_codec or DEFAULT_CODEC
     client = await session.ws_connect(url, compress=15, max_msg_size=0)
     msgs = []
 
-    version = await client.receive_json()
+    version = await client.receive_json(loads=codec.loads)
     msgs.append(version)
 
     for to_send in (
@@ -35,8 +38,8 @@ async def dump_msgs(
         },
         {"command": "start_listening", "messageId": "start-listening"},
     ):
-        await client.send_json(to_send)
-        msgs.append(await client.receive_json())
+        await client.send_json(to_send, dumps=codec.dumps)
+        msgs.append(await client.receive_json(loads=codec.loads))
 
     if timeout is None:
         await client.close()
@@ -48,7 +51,7 @@ async def dump_msgs(
 
     while True:
         try:
-            msg = await client.receive_json()
+            msg = await client.receive_json(loads=codec.loads)
             msgs.append(msg)
         except asyncio.CancelledError:
             break
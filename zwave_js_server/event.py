@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from enum import StrEnum
 import logging
-from typing import Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from .client import Client
 
 LOGGER = logging.getLogger(__package__)
 
@@ -27,6 +31,86 @@ class BaseEventModel(BaseModel):
         )
 
 
+class EventValidationMode(StrEnum):
+    """Enum with the modes to validate incoming events."""
+
+    # Validate every event and raise on invalid events
+    STRICT = "strict"
+    # Validate one in every N events and log invalid events
+    SAMPLED = "sampled"
+    # Don't validate events
+    OFF = "off"
+
+
+@dataclass(frozen=True)
+class EventValidationStats:
+    """Represent event validation counters."""
+
+    validated: int
+    skipped: int
+    failures: int
+
+
+class EventValidator:
+    """Validate incoming events against their event models."""
+
+    def __init__(
+        self,
+        mode: EventValidationMode = EventValidationMode.STRICT,
+        sample_rate: int = 100,
+    ) -> None:
+        """Initialize the validator.
+
+        In sampled mode, one in every sample_rate events is validated.
+        """
+        if sample_rate < 1:
+            raise ValueError("sample_rate must be at least 1")
+        self.mode = EventValidationMode(mode)
+        self.sample_rate = sample_rate
+        self._validated = 0
+        self._skipped = 0
+        self._failures = 0
+
+    @property
+    def stats(self) -> EventValidationStats:
+        """Return the event validation counters."""
+        return EventValidationStats(self._validated, self._skipped, self._failures)
+
+    def validate(self, model: type[BaseEventModel], data: dict) -> None:
+        """Validate event data according to the validation mode.
+
+        Raises pydantic.ValidationError for invalid events in strict mode.
+        """
+        if self.mode == EventValidationMode.OFF or (
+            self.mode == EventValidationMode.SAMPLED
+            and (self._validated + self._skipped) % self.sample_rate
+        ):
+            self._skipped += 1
+            return
+
+        self._validated += 1
+        try:
+            model.from_dict(data)
+        except (KeyError, ValidationError):
+            self._failures += 1
+            if self.mode == EventValidationMode.STRICT:
+                raise
+            LOGGER.warning("Received invalid %s event: %s", data.get("event"), data)
+
+
+def validate_event(
+    client: Client | None, model: type[BaseEventModel], data: dict
+) -> None:
+    """Validate event data with the event validator of the client.
+
+    Models built without a client validate every event like in strict mode.
+    """
+    if (validator := getattr(client, "event_validator", None)) is None:
+        model.from_dict(data)
+        return
+    validator.validate(model, data)
+
+
 @dataclass
 class Event:
     """Represent an event."""
@@ -35,26 +119,65 @@ class Event:
     data: dict = field(default_factory=dict)
 
 
-class EventBase:
-    """Represent a Z-Wave JS base class for event handling models."""
+def _build_event_handlers(cls: type[EventBase]) -> None:
+    """Build the event handler dispatch table of a class and its subclasses."""
+    cls._event_handlers = {  # pylint: disable=protected-access
+        name.removeprefix("handle_").replace("_", " "): handler
+        for name in dir(cls)
+        if name.startswith("handle_") and callable(handler := getattr(cls, name))
+    }
+    for subclass in cls.__subclasses__():
+        _build_event_handlers(subclass)
 
-    def __init__(self) -> None:
-        """Initialize event base."""
-        self._listeners: dict[str, list[Callable]] = {}
 
-    def on(self, event_name: str, callback: Callable) -> Callable:
-        """Register an event callback."""
-        listeners: list = self._listeners.setdefault(event_name, [])
-        listeners.append(callback)
+class _EventBaseType(type):
+    """Keep the event handler dispatch tables current when handlers are replaced."""
 
-        def unsubscribe() -> None:
-            """Unsubscribe listeners."""
-            if callback in listeners:
-                listeners.remove(callback)
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """Set a class attribute."""
+        super().__setattr__(name, value)
+        if name.startswith("handle_"):
+            _build_event_handlers(cast("type[EventBase]", cls))
 
-        return unsubscribe
+    def __delattr__(cls, name: str) -> None:
+        """Delete a class attribute."""
+        super().__delattr__(name)
+        if name.startswith("handle_"):
+            _build_event_handlers(cast("type[EventBase]", cls))
+
+
+class EventBase(metaclass=_EventBaseType):
+    """Represent a Z-Wave JS base class for event handling models."""
 
-    def once(self, event_name: str, callback: Callable) -> Callable:
+    # Map of event type to the handler function for that event type, built when
+    # the class is created and rebuilt when a handler of the class is replaced
+    _event_handlers: ClassVar[dict[str, Callable[[Any, Event], None]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the event handler dispatch table of the class."""
+        super().__init_subclass__(**kwargs)
+        _build_event_handlers(cls)
+
+    def __init__(self) -> None:
+        """Initialize event base."""
+        # Listeners are stored in insertion order by their handle, which allows
+        # removing them in constant time
+        self._listeners: dict[str, dict[ListenerHandle, Callable]] = {}
+        # Snapshots of the listeners that emit iterates over, only rebuilt after
+        # listeners were added or removed
+        self._listener_snapshots: dict[str, tuple[Callable, ...]] = {}
+
+    def on(self, event_name: str, callback: Callable) -> ListenerHandle:
+        """Register an event callback.
+
+        Call the returned handle to unsubscribe the callback.
+        """
+        handle = ListenerHandle(self, event_name)
+        self._listeners.setdefault(event_name, {})[handle] = callback
+        self._listener_snapshots.pop(event_name, None)
+        return handle
+
+    def once(self, event_name: str, callback: Callable) -> ListenerHandle:
         """Listen for an event exactly once."""
 
         def event_listener(data: dict) -> None:
@@ -67,16 +190,50 @@ class EventBase:
 
     def emit(self, event_name: str, data: dict) -> None:
         """Run all callbacks for an event."""
-        for listener in self._listeners.get(event_name, []).copy():
+        if (listeners := self._listener_snapshots.get(event_name)) is None:
+            if not (registered := self._listeners.get(event_name)):
+                return
+            listeners = self._listener_snapshots[event_name] = tuple(
+                registered.values()
+            )
+        for listener in listeners:
             try:
                 listener(data)
             except Exception:  # pylint: disable=broad-exception-caught
                 LOGGER.exception("Error handling event: %s", event_name)
 
+    def _remove_listener(self, event_name: str, handle: ListenerHandle) -> None:
+        """Remove the listener of a handle."""
+        if (listeners := self._listeners.get(event_name)) is None:
+            return
+        if listeners.pop(handle, None) is not None:
+            self._listener_snapshots.pop(event_name, None)
+            if not listeners:
+                del self._listeners[event_name]
+
     def _handle_event_protocol(self, event: Event) -> None:
         """Process an event based on event protocol."""
-        handler = getattr(self, f"handle_{event.type.replace(' ', '_')}", None)
-        if handler is None:
+        if (handler := self._event_handlers.get(event.type)) is None:
             LOGGER.debug("Received unknown event: %s", event)
             return
-        handler(event)  # pylint: disable=not-callable
+        handler(self, event)
+
+
+class ListenerHandle:
+    """Represent a handle of a registered event listener.
+
+    Calling the handle unsubscribes the listener.
+    """
+
+    __slots__ = ("_event_base", "_event_name")
+
+    def __init__(self, event_base: EventBase, event_name: str) -> None:
+        """Initialize the handle."""
+        self._event_base = event_base
+        self._event_name = event_name
+
+    def __call__(self) -> None:
+        """Unsubscribe the listener."""
+        self._event_base._remove_listener(self._event_name, self)
+
+    unsubscribe = __call__
@@ -94,6 +94,17 @@ class FailedCommand(BaseZwaveJSServerError):
         self.error_code = error_code
 
 
+class CommandTimeout(FailedCommand):
+    """When no result for a command was received in time."""
+
+    def __init__(self, message_id: str, timeout: float) -> None:
+        """Initialize a command timeout error."""
+        super().__init__(
+            message_id, "timeout", f"No result received within {timeout} seconds"
+        )
+        self.timeout = timeout
+
+
 class FailedZWaveCommand(FailedCommand):
     """When a command has failed because of Z-Wave JS error."""
 
@@ -6,20 +6,130 @@ https://zwave-js.github.io/node-zwave-js/#/api/config-manager
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from collections import OrderedDict
+import copy
+import logging
+import os
+from typing import TYPE_CHECKING, Any, cast
 
-from ..device_config import DeviceConfig
+from ..device_config import DeviceConfig, DeviceConfigDataType
 
 if TYPE_CHECKING:
     from ...client import Client
 
+_LOGGER = logging.getLogger(__package__)
+
+# Number of device lookups that are kept in memory
+DEFAULT_LOOKUP_CACHE_SIZE = 256
+
+# manufacturerId, productType, productId, firmwareVersion, configVersion
+LookupKey = tuple[int, int, int, str | None, str]
+
 
 class ConfigManager:
     """Model for the Z-Wave JS config manager."""
 
-    def __init__(self, client: Client) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        client: Client,
+        cache_size: int = DEFAULT_LOOKUP_CACHE_SIZE,
+        cache_path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Initialize.
+
+        Device lookups are cached per config DB version (`Driver.config_version`),
+        in memory for the last cache_size lookups and, when cache_path is set, in a
+        JSON Lines file that is kept across restarts. The file is loaded once per
+        config DB version and all file operations run one at a time.
+        """
         self._client = client
+        self.cache_size = cache_size
+        self.cache_path = cache_path
+        self._cache: OrderedDict[LookupKey, DeviceConfigDataType | None] = OrderedDict()
+        self._disk_cache: dict[LookupKey, DeviceConfigDataType | None] | None = None
+        # Config DB version of the lookups in _disk_cache
+        self._disk_cache_version: str | None = None
+        # Serializes loading, appending to and removing the cache file
+        self._disk_lock = asyncio.Lock()
+        # Config DB version that was replaced by a config update. The driver state
+        # still reports it until the client reconnects, so lookups aren't cached
+        # for it.
+        self._stale_config_version: str | None = None
+
+    def _get_config_version(self) -> str | None:
+        """Return the config DB version that lookups can be cached for."""
+        if (driver := self._client.driver) is None:
+            return None
+        if (config_version := driver.config_version) == self._stale_config_version:
+            return None
+        return config_version
+
+    def _cache_get(self, key: LookupKey) -> tuple[bool, DeviceConfigDataType | None]:
+        """Return whether the lookup is cached in memory and its result."""
+        if key not in self._cache:
+            return False, None
+        self._cache.move_to_end(key)
+        return True, self._cache[key]
+
+    def _cache_set(self, key: LookupKey, config: DeviceConfigDataType | None) -> None:
+        """Cache the result of a lookup in memory."""
+        self._cache[key] = config
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _encode_disk_record(
+        self, key: LookupKey, config: DeviceConfigDataType | None
+    ) -> str:
+        """Return the line of a lookup in the cache on disk."""
+        return f"{self._client.json_codec.dumps({'key': key, 'config': config})}\n"
+
+    def _load_disk_cache(
+        self, path: str | os.PathLike[str], config_version: str
+    ) -> dict[LookupKey, DeviceConfigDataType | None]:
+        """Load the lookups cached on disk for a config DB version.
+
+        Lookups of other config DB versions are pruned from the file.
+        """
+        disk_cache: dict[LookupKey, DeviceConfigDataType | None] = {}
+        prune = False
+        try:
+            with open(path, encoding="utf8") as fp:
+                for line in fp:
+                    if not line.strip():
+                        continue
+                    record = self._client.json_codec.loads(line)
+                    key = cast(LookupKey, tuple(record["key"]))
+                    if key[-1] == config_version:
+                        disk_cache[key] = record["config"]
+                    else:
+                        prune = True
+        except FileNotFoundError:
+            return disk_cache
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            _LOGGER.warning("Ignoring invalid device lookup cache %s: %s", path, err)
+            prune = True
+        if prune:
+            tmp_path = f"{os.fspath(path)}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf8") as fp:
+                    for key, config in disk_cache.items():
+                        fp.write(self._encode_disk_record(key, config))
+                os.replace(tmp_path, path)
+            except OSError as err:
+                _LOGGER.warning("Unable to prune device lookup cache %s: %s", path, err)
+        return disk_cache
+
+    def _write_disk_cache(
+        self,
+        path: str | os.PathLike[str],
+        key: LookupKey,
+        config: DeviceConfigDataType | None,
+    ) -> None:
+        """Append a lookup to the cache on disk."""
+        with open(path, "a", encoding="utf8") as fp:
+            fp.write(self._encode_disk_record(key, config))
 
     async def lookup_device(
         self,
@@ -28,7 +138,37 @@ class ConfigManager:
         product_id: int,
         firmware_version: str | None = None,
     ) -> DeviceConfig | None:
-        """Look up the definition of a given device in the configuration DB."""
+        """Look up the definition of a given device in the configuration DB.
+
+        Every call returns a new DeviceConfig, also for cached lookups.
+        """
+        key: LookupKey | None = None
+        cache_path = self.cache_path
+        if (config_version := self._get_config_version()) is not None:
+            key = (
+                manufacturer_id,
+                product_type,
+                product_id,
+                firmware_version,
+                config_version,
+            )
+            cached, config = self._cache_get(key)
+            if not cached and cache_path is not None:
+                async with self._disk_lock:
+                    # Concurrent lookups wait for the first one to load the file
+                    disk_cache = self._disk_cache
+                    if disk_cache is None or self._disk_cache_version != config_version:
+                        disk_cache = await asyncio.get_running_loop().run_in_executor(
+                            None, self._load_disk_cache, cache_path, config_version
+                        )
+                        self._disk_cache = disk_cache
+                        self._disk_cache_version = config_version
+                if key in disk_cache:
+                    cached, config = True, disk_cache[key]
+                    self._cache_set(key, config)
+            if cached:
+                return _make_device_config(config)
+
         cmd: dict[str, Any] = {
             "command": "config_manager.lookup_device",
             "manufacturerId": manufacturer_id,
@@ -41,7 +181,51 @@ class ConfigManager:
 
         data = await self._client.async_send_command(cmd)
 
-        if not data or not (config := data.get("config")):
-            return None
+        config = (data.get("config") if data else None) or None
+
+        if key is not None:
+            self._cache_set(key, config)
+            if cache_path is not None:
+                async with self._disk_lock:
+                    # Skip the file when it was invalidated or loaded for another
+                    # config DB version in the meantime
+                    if (
+                        self._disk_cache is not None
+                        and self._disk_cache_version == config_version
+                    ):
+                        self._disk_cache[key] = config
+                        await asyncio.get_running_loop().run_in_executor(
+                            None, self._write_disk_cache, cache_path, key, config
+                        )
+
+        return _make_device_config(config)
+
+    async def async_invalidate_cache(self) -> None:
+        """Remove all cached lookups, in memory and on disk.
+
+        Called after a config update was installed. Lookups aren't cached again
+        until the driver reports a new config DB version.
+        """
+        if (driver := self._client.driver) is not None:
+            self._stale_config_version = driver.config_version
+        self._cache.clear()
+        self._disk_cache = None
+        self._disk_cache_version = None
+        if self.cache_path is not None:
+            async with self._disk_lock:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _remove_file, self.cache_path
+                )
+
+
+def _make_device_config(config: DeviceConfigDataType | None) -> DeviceConfig | None:
+    """Return a DeviceConfig for a lookup result that doesn't share the cached data."""
+    return DeviceConfig(copy.deepcopy(config)) if config else None
+
 
-        return DeviceConfig(config)
+def _remove_file(path: str | os.PathLike[str]) -> None:
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from functools import cached_property
 import logging
 from typing import TYPE_CHECKING, Any, Literal, cast
@@ -15,16 +16,18 @@ from ...const import (
     ExclusionStrategy,
     InclusionState,
     InclusionStrategy,
+    NodeStatus,
     NodeType,
     QRCodeVersion,
     RFRegion,
     RemoveNodeReason,
     ZwaveFeature,
 )
-from ...event import Event, EventBase
+from ...event import Event, EventBase, validate_event
 from ...util.helpers import convert_base64_to_bytes, convert_bytes_to_base64
 from ..association import AssociationAddress, AssociationGroup
 from ..node import Node
+from ..node.data_model import NodeDataType
 from ..node.firmware import NodeFirmwareUpdateResult
 from .data_model import (
     BackgroundRSSI,
@@ -55,6 +58,14 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__package__)
 
+# Node events that correspond to a node status, emitted by resync
+NODE_STATUS_EVENTS = {
+    NodeStatus.ASLEEP: "sleep",
+    NodeStatus.AWAKE: "wake up",
+    NodeStatus.DEAD: "dead",
+    NodeStatus.ALIVE: "alive",
+}
+
 DEFAULT_CONTROLLER_STATISTICS = (  # pylint: disable=invalid-name
     ControllerStatisticsDataType(
         messagesTX=0,
@@ -70,19 +81,35 @@ DEFAULT_CONTROLLER_STATISTICS = (  # pylint: disable=invalid-name
 )
 
 
+def _consume(items: list[NodeDataType]) -> Iterator[NodeDataType]:
+    """Yield the items of a list in order while removing them from the list."""
+    items.reverse()
+    while items:
+        yield items.pop()
+
+
 class Controller(EventBase):
     """Represent a Z-Wave JS controller."""
 
-    def __init__(self, client: Client, state: dict) -> None:
-        """Initialize controller."""
+    def __init__(self, client: Client, state: dict, copy_data: bool = True) -> None:
+        """Initialize controller.
+
+        When copy_data is False, the nodes take ownership of their state data
+        instead of copying it (see `Node.update`).
+        """
         super().__init__()
         self.client = client
         self.nodes: dict[int, Node] = {}
         self._rebuild_routes_progress: dict[Node, RebuildRoutesStatus] | None = None
         self._last_rebuild_routes_result: dict[Node, RebuildRoutesStatus] | None = None
         self._statistics = ControllerStatistics(DEFAULT_CONTROLLER_STATISTICS)
-        for node_state in state["nodes"]:
-            node = Node(client, node_state)
+        node_states: Iterable[NodeDataType] = state["nodes"]
+        if not copy_data:
+            # Nodes are built one at a time from a state that is owned by the
+            # controller, so release each node state once its node is built
+            node_states = _consume(state["nodes"])
+        for node_state in node_states:
+            node = Node(client, node_state, copy_data)
             self.nodes[node.node_id] = node
         self.update(state["controller"])
 
@@ -284,6 +311,60 @@ class Controller(EventBase):
                 self.data["rebuildRoutesProgress"]
             )
 
+    def resync(self, state: dict, copy_data: bool = True) -> None:
+        """Update the controller and its nodes from a new state dump.
+
+        Existing nodes are updated in place and emit value events for the values
+        that changed while the client was disconnected, and the node status event
+        if their status changed. Nodes that are missing from the state emit a
+        `node removed` event with a reason of None, since the reason isn't known,
+        and new nodes emit a `node added` event with a result of None.
+        """
+        node_states = {
+            node_state["nodeId"]: node_state for node_state in state["nodes"]
+        }
+        for node_id in set(self.nodes) - set(node_states):
+            node = self.nodes.pop(node_id)
+            # Remove client from node since it's no longer connected to the controller
+            node.client = None  # type: ignore[assignment]
+            self.emit(
+                "node removed",
+                {
+                    "source": "controller",
+                    "event": "node removed",
+                    "node": node,
+                    "reason": None,
+                    "controller": self,
+                },
+            )
+        for node_id, node_state in node_states.items():
+            if node_id not in self.nodes:
+                node = self.nodes[node_id] = Node(self.client, node_state, copy_data)
+                self.emit(
+                    "node added",
+                    {
+                        "source": "controller",
+                        "event": "node added",
+                        "node": node,
+                        "result": None,
+                        "controller": self,
+                    },
+                )
+                continue
+            node = self.nodes[node_id]
+            prev_status = node.status
+            node.update(node_state, copy_data, emit_value_events=True)
+            if node.status != prev_status and (
+                event_type := NODE_STATUS_EVENTS.get(node.status)
+            ):
+                node.receive_event(
+                    Event(
+                        event_type,
+                        {"source": "node", "event": event_type, "nodeId": node_id},
+                    )
+                )
+        self.update(state["controller"])
+
     async def async_begin_inclusion(
         self,
         inclusion_strategy: Literal[
@@ -1036,7 +1117,7 @@ class Controller(EventBase):
             _LOGGER.info("Unhandled controller event: %s", event_type)
             return
 
-        CONTROLLER_EVENT_MODEL_MAP[event_type].from_dict(event.data)
+        validate_event(self.client, CONTROLLER_EVENT_MODEL_MAP[event_type], event.data)
         self._handle_event_protocol(event)
 
         event.data["controller"] = self
@@ -1069,7 +1150,9 @@ class Controller(EventBase):
 
     def handle_node_added(self, event: Event) -> None:
         """Process a node added event."""
-        node = event.data["node"] = Node(self.client, event.data["node"])
+        node = event.data["node"] = Node(
+            self.client, event.data["node"], copy_data=False
+        )
         self.nodes[node.node_id] = node
 
     def handle_node_removed(self, event: Event) -> None:
@@ -226,3 +226,69 @@ class DeviceConfig:
     def to_dict(self) -> DeviceConfigDataType:
         """Return dict representation of device config."""
         return self.data.copy()
+
+
+def _device_config_key(data: DeviceConfigDataType) -> tuple[Any, ...]:
+    """Return a cheap key that identifies the device a device config is for."""
+    firmware_version = data.get("firmwareVersion", {})
+    return (
+        data.get("filename"),
+        data.get("manufacturerId"),
+        tuple(
+            (device.get("productType"), device.get("productId"))
+            for device in data.get("devices", [])
+        ),
+        firmware_version.get("min"),
+        firmware_version.get("max"),
+    )
+
+
+class DeviceConfigCache:
+    """Share device configs between nodes with equal device configs.
+
+    Nodes of the same model carry the same device config, which includes the
+    (large) configuration parameter information. All nodes with an equal device
+    config share one DeviceConfig instance and its data dict, which is also the
+    `deviceConfig` of their node data. Treat both as read-only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        # A cheap key narrows down the candidates, which are then compared in full
+        self._cache: dict[tuple[Any, ...], list[DeviceConfig]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached device configs."""
+        return sum(len(device_configs) for device_configs in self._cache.values())
+
+    def get(self, data: DeviceConfigDataType) -> DeviceConfig:
+        """Return the cached device config that is equal to data, adding it if needed.
+
+        When data isn't cached yet, the cache takes it over without copying it.
+        """
+        key = _device_config_key(data)
+        if (device_configs := self._cache.get(key)) is None:
+            device_configs = self._cache[key] = []
+        for device_config in device_configs:
+            if device_config.data is data or device_config.data == data:
+                return device_config
+        device_config = DeviceConfig(data)
+        device_configs.append(device_config)
+        return device_config
+
+    def discard(self, device_config: DeviceConfig) -> None:
+        """Remove a device config from the cache if it is cached.
+
+        Nodes that use the device config keep it.
+        """
+        key = _device_config_key(device_config.data)
+        if (device_configs := self._cache.get(key)) is None:
+            return
+        if device_config in device_configs:
+            device_configs.remove(device_config)
+        if not device_configs:
+            del self._cache[key]
+
+    def clear(self) -> None:
+        """Remove all device configs from the cache."""
+        self._cache.clear()
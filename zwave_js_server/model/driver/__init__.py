@@ -13,7 +13,7 @@ from zwave_js_server.model.firmware import (
 )
 
 from ...const import CommandClass
-from ...event import BaseEventModel, Event, EventBase
+from ...event import BaseEventModel, Event, EventBase, validate_event
 from ..config_manager import ConfigManager
 from ..controller import Controller
 from ..log_config import LogConfig, LogConfigDataType
@@ -192,21 +192,42 @@ class Driver(EventBase):
     """Represent a Z-Wave JS driver."""
 
     def __init__(
-        self, client: Client, state: dict, log_config: LogConfigDataType
+        self,
+        client: Client,
+        state: dict,
+        log_config: LogConfigDataType,
+        copy_data: bool = True,
     ) -> None:
-        """Initialize driver."""
+        """Initialize driver.
+
+        When copy_data is False, the state is owned by the driver afterwards and
+        node state is not copied (see `Node.update`).
+        """
         super().__init__()
         self.client = client
         self.data: DriverDataType = state.get("driver", {})
-        self.controller = Controller(client, state)
+        self.controller = Controller(client, state, copy_data)
         self.log_config = LogConfig.from_dict(log_config)
-        self.config_manager = ConfigManager(client)
+        self.config_manager = ConfigManager(
+            client, cache_path=client.device_lookup_cache_path
+        )
         self._firmware_update_progress: DriverFirmwareUpdateProgress | None = None
 
     def __hash__(self) -> int:
         """Return the hash."""
         return hash(self.controller)
 
+    def resync(
+        self, state: dict, log_config: LogConfigDataType, copy_data: bool = True
+    ) -> None:
+        """Update the driver from a new state dump after a reconnect.
+
+        Existing objects are kept, see `Controller.resync`.
+        """
+        self.data = state.get("driver", {})
+        self.log_config = LogConfig.from_dict(log_config)
+        self.controller.resync(state, copy_data)
+
     def __eq__(self, other: object) -> bool:
         """Return whether this instance equals another."""
         if not isinstance(other, Driver):
@@ -243,7 +264,7 @@ class Driver(EventBase):
             _LOGGER.info("Unhandled driver event: %s", event_type)
             return
 
-        DRIVER_EVENT_MODEL_MAP[event_type].from_dict(event.data)
+        validate_event(self.client, DRIVER_EVENT_MODEL_MAP[event_type], event.data)
         self._handle_event_protocol(event)
 
         self.emit(event_type, event.data)
@@ -305,7 +326,10 @@ class Driver(EventBase):
         result = await self._async_send_command(
             "install_config_update", require_schema=5
         )
-        return cast(bool, result["success"])
+        if success := cast(bool, result["success"]):
+            # Device lookups from the old config DB version are outdated
+            await self.config_manager.async_invalidate_cache()
+        return success
 
     async def async_firmware_update_otw(
         self,
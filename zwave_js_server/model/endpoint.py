@@ -118,7 +118,11 @@ class Endpoint(EventBase):
     def update(
         self, data: EndpointDataType, values: dict[str, ConfigurationValue | Value]
     ) -> None:
-        """Update the endpoint data."""
+        """Update the endpoint data.
+
+        The node passes its live view of the values on this endpoint, which it
+        keeps up to date when values are added or removed.
+        """
         self.data = data
         self.__dict__.pop("command_classes", None)
         if (device_class := self.data.get("deviceClass")) is None:
@@ -126,25 +130,13 @@ class Endpoint(EventBase):
         else:
             self._device_class = DeviceClass(device_class)
 
-        # Remove stale values
-        self.values = {
-            value_id: val for value_id, val in self.values.items() if value_id in values
-        }
-
-        # Populate new values
-        for value_id, value in values.items():
-            if value_id not in self.values:
-                self.values[value_id] = value
+        self.values = values
 
     def get_command_class_values(
         self, command_class: CommandClass
     ) -> dict[str, ConfigurationValue | Value]:
         """Return all values for a given command class."""
-        return {
-            value_id: value
-            for value_id, value in self.values.items()
-            if value.command_class == command_class
-        }
+        return self.node.get_command_class_values(command_class, self.index)
 
     def get_configuration_values(self) -> dict[str, ConfigurationValue]:
         """Return all configuration values for an endpoint."""
@@ -158,6 +150,7 @@ class Endpoint(EventBase):
         cmd: str,
         require_schema: int | None = None,
         wait_for_result: bool | None = None,
+        command_timeout: float | None = None,
         **cmd_kwargs: Any,
     ) -> dict[str, Any] | None:
         """
@@ -165,12 +158,15 @@ class Endpoint(EventBase):
 
         If wait_for_result is not None, it will take precedence, otherwise we will
         decide to wait or not based on the node status.
+
+        command_timeout overrides the default time to wait for the result, see
+        `Client.async_send_command`.
         """
         if self.client.driver is None:
             raise FailedCommand(
                 "Command failed", "failed_command", "The client is not connected"
             )
-        kwargs = {}
+        kwargs: dict[str, Any] = {}
         message = {
             "command": f"endpoint.{cmd}",
             "nodeId": self.node_id,
@@ -179,9 +175,12 @@ class Endpoint(EventBase):
         }
         if require_schema is not None:
             kwargs["require_schema"] = require_schema
+        wait_kwargs = kwargs
+        if command_timeout is not None:
+            wait_kwargs = {**kwargs, "timeout": command_timeout}
 
         if wait_for_result:
-            result = await self.client.async_send_command(message, **kwargs)
+            result = await self.client.async_send_command(message, **wait_kwargs)
             return result
 
         if wait_for_result is None and self.node.status not in (
@@ -189,7 +188,7 @@ class Endpoint(EventBase):
             NodeStatus.DEAD,
         ):
             result_task = asyncio.create_task(
-                self.client.async_send_command(message, **kwargs)
+                self.client.async_send_command(message, **wait_kwargs)
             )
             status_task = asyncio.create_task(self.node.status_event.wait())
             await asyncio.wait(
@@ -322,7 +321,7 @@ class Endpoint(EventBase):
                 "are not included"
             )
 
-        options = {
+        options: dict[str, Any] = {
             "value": new_value,
             "parameter": property_,
             "bitMask": property_key,
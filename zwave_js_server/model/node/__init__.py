@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 import copy
 from datetime import datetime
 import logging
@@ -18,7 +19,7 @@ from ...const import (
     Protocols,
     SecurityClass,
 )
-from ...event import Event, EventBase
+from ...event import Event, EventBase, ListenerHandle, validate_event
 from ...exceptions import NotFoundError, UnparseableValue, UnwriteableValue
 from ..access_control import (
     AccessControlAPI,
@@ -53,6 +54,7 @@ from ..value import (
     SetValueResult,
     Value,
     ValueDataType,
+    ValueID,
     ValueMetadata,
     ValueNotification,
     _get_value_id_str_from_dict,
@@ -108,11 +110,25 @@ def _get_value_id_dict_from_value_data(value_data: ValueDataType) -> dict[str, A
     return data
 
 
+def _remove_from_value_index(
+    index: dict[Any, dict[str, ConfigurationValue | Value]], key: Any, value_id: str
+) -> None:
+    """Remove a value ID from a value index."""
+    # Empty entries are kept because endpoints share their entry of the endpoint
+    # index as their live view of the endpoint values
+    del index[key][value_id]
+
+
 class Node(EventBase):
     """Represent a Z-Wave JS node."""
 
-    def __init__(self, client: Client, data: NodeDataType) -> None:
-        """Initialize the node."""
+    def __init__(
+        self, client: Client, data: NodeDataType, copy_data: bool = True
+    ) -> None:
+        """Initialize the node.
+
+        See `update` for the meaning of copy_data.
+        """
         super().__init__()
         self.client = client
         self.data: NodeDataType = {}
@@ -124,9 +140,22 @@ class Node(EventBase):
         self._device_class: DeviceClass | None = None
         self._last_seen: datetime | None = None
         self.values: dict[str, ConfigurationValue | Value] = {}
+        # Secondary indexes of self.values, kept up to date whenever values are
+        # added, updated or removed
+        self._values_by_command_class: dict[
+            int, dict[str, ConfigurationValue | Value]
+        ] = {}
+        self._values_by_endpoint: dict[
+            int | None, dict[str, ConfigurationValue | Value]
+        ] = {}
+        self._values_by_command_class_endpoint: dict[
+            tuple[int, int | None], dict[str, ConfigurationValue | Value]
+        ] = {}
         self.endpoints: dict[int, Endpoint] = {}
+        # Listeners for the events of a single value, keyed by value ID
+        self._value_listeners = EventBase()
         self.status_event = asyncio.Event()
-        self.update(data)
+        self.update(data, copy_data)
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -146,9 +175,11 @@ class Node(EventBase):
 
     def _init_value(self, val: ValueDataType) -> Value | ConfigurationValue:
         """Initialize a Value object from ValueDataType."""
+        # Nodes built without a client don't share metadata
+        metadata_pool = getattr(self.client, "metadata_pool", None)
         if val["commandClass"] == CommandClass.CONFIGURATION:
-            return ConfigurationValue(self, val)
-        return Value(self, val)
+            return ConfigurationValue(self, val, metadata_pool)
+        return Value(self, val, metadata_pool)
 
     @property
     def node_id(self) -> int:
@@ -279,7 +310,12 @@ class Node(EventBase):
 
     @property
     def device_config(self) -> DeviceConfig:
-        """Return the device_config."""
+        """Return the device_config.
+
+        The instance and its data, which is the deviceConfig of the node data, are
+        shared between nodes with an equal device config, so treat them as
+        read-only.
+        """
         return self._device_config
 
     @property
@@ -424,6 +460,49 @@ class Node(EventBase):
             return Protocols(self.data["protocol"])
         return None
 
+    def _index_value(self, value_id: str, value: ConfigurationValue | Value) -> None:
+        """Add a value to the value indexes."""
+        command_class, endpoint = value.command_class, value.endpoint
+        self._values_by_command_class.setdefault(command_class, {})[value_id] = value
+        self._values_by_endpoint.setdefault(endpoint, {})[value_id] = value
+        self._values_by_command_class_endpoint.setdefault(
+            (command_class, endpoint), {}
+        )[value_id] = value
+
+    def _unindex_value(
+        self, value_id: str, command_class: int, endpoint: int | None
+    ) -> None:
+        """Remove a value from the value indexes."""
+        _remove_from_value_index(self._values_by_command_class, command_class, value_id)
+        _remove_from_value_index(self._values_by_endpoint, endpoint, value_id)
+        _remove_from_value_index(
+            self._values_by_command_class_endpoint, (command_class, endpoint), value_id
+        )
+
+    def _add_value(self, value_id: str, value: ConfigurationValue | Value) -> None:
+        """Add a value to the node."""
+        self.values[value_id] = value
+        self._index_value(value_id, value)
+
+    def _pop_value(self, value_id: str) -> ConfigurationValue | Value:
+        """Remove a value from the node and return it."""
+        value = self.values.pop(value_id)
+        self._unindex_value(value_id, value.command_class, value.endpoint)
+        return value
+
+    def _update_value(
+        self, value_id: str, value: ConfigurationValue | Value, data: ValueDataType
+    ) -> None:
+        """Update an existing value of the node."""
+        # The endpoint can change between None and 0 without changing the value ID
+        endpoint = value.endpoint
+        try:
+            value.update(data)
+        finally:
+            if value.endpoint != endpoint:
+                self._unindex_value(value_id, value.command_class, endpoint)
+                self._index_value(value_id, value)
+
     def _update_endpoints(self, endpoints: list[EndpointDataType]) -> None:
         """Update the endpoints data."""
         new_endpoints_data = {endpoint["index"]: endpoint for endpoint in endpoints}
@@ -434,14 +513,12 @@ class Node(EventBase):
         for endpoint_idx in stale_endpoint_idxs:
             self.endpoints.pop(endpoint_idx)
 
-        # Add new endpoints or update existing ones
+        # Add new endpoints or update existing ones. The values were already
+        # partitioned by endpoint in the endpoint index, which each endpoint uses
+        # as its live view of its values.
         for endpoint_idx in new_endpoint_idxs:
             endpoint = new_endpoints_data[endpoint_idx]
-            values = {
-                value_id: value
-                for value_id, value in self.values.items()
-                if endpoint_idx == value.endpoint
-            }
+            values = self._values_by_endpoint.setdefault(endpoint_idx, {})
             if endpoint_idx in self.endpoints:
                 self.endpoints[endpoint_idx].update(endpoint, values)
             else:
@@ -449,17 +526,33 @@ class Node(EventBase):
                     self.client, self, endpoint, values
                 )
 
-    def _update_values(self, values: list[ValueDataType]) -> None:
-        """Update the values data."""
+    def _update_values(
+        self, values: list[ValueDataType], diff_values: bool = False
+    ) -> list[dict[str, Any]]:
+        """Update the values data.
+
+        When diff_values is True, the data of the value added, value updated,
+        metadata updated and value removed events for the values that changed is
+        returned.
+        """
         new_values_data = {
             _get_value_id_str_from_dict(self, val): val for val in values
         }
         new_value_ids = set(new_values_data)
         stale_value_ids = set(self.values) - new_value_ids
+        value_events: list[dict[str, Any]] = []
 
         # Remove stale values
         for value_id in stale_value_ids:
-            self.values.pop(value_id)
+            removed_value = self._pop_value(value_id)
+            if diff_values:
+                value_events.append(
+                    self._get_value_event_data(
+                        "value removed",
+                        removed_value,
+                        {"prevValue": removed_value.data.get("value")},
+                    )
+                )
 
         # Updating existing values and populate new values. Preserve value order if
         # initializing values for the node for the first time by using the key order
@@ -471,18 +564,104 @@ class Node(EventBase):
         ):
             val = new_values_data[value_id]
             try:
-                if value_id in self.values:
-                    self.values[value_id].update(val)
-                else:
-                    self.values[value_id] = self._init_value(val)
+                if (value := self.values.get(value_id)) is None:
+                    value = self._init_value(val)
+                    self._add_value(value_id, value)
+                    if diff_values:
+                        value_events.append(
+                            self._get_value_event_data(
+                                "value added", value, {"newValue": val.get("value")}
+                            )
+                        )
+                    continue
+
+                if not diff_values:
+                    self._update_value(value_id, value, val)
+                    continue
+
+                prev_value = value.data.get("value")
+                metadata_changed = any(
+                    value.metadata.data.get(key) != meta_val
+                    for key, meta_val in val.get("metadata", {}).items()
+                )
+                self._update_value(value_id, value, val)
+                if (new_value := value.data.get("value")) != prev_value:
+                    value_events.append(
+                        self._get_value_event_data(
+                            "value updated",
+                            value,
+                            {"prevValue": prev_value, "newValue": new_value},
+                        )
+                    )
+                elif metadata_changed:
+                    value_events.append(
+                        self._get_value_event_data(
+                            "metadata updated",
+                            value,
+                            {"metadata": value.metadata.data, "value": new_value},
+                        )
+                    )
             except UnparseableValue:
                 # If we can't parse the value, don't store it
                 pass
 
-    def update(self, data: NodeDataType) -> None:
-        """Update the internal state data."""
-        self.data = copy.deepcopy(data)
-        self._device_config = DeviceConfig(self.data.get("deviceConfig", {}))
+        return value_events
+
+    def _get_value_event_data(
+        self,
+        event_type: str,
+        value: ConfigurationValue | Value,
+        event_args: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Return the data of a value event for a value."""
+        args = _get_value_id_dict_from_value_data(value.data)
+        for key in ("commandClassName", "propertyName", "propertyKeyName"):
+            if key in value.data:
+                args[key] = value.data[key]
+        args.update(event_args)
+        return {
+            "source": "node",
+            "event": event_type,
+            "nodeId": self.node_id,
+            "args": args,
+            "node": self,
+            "value": value,
+        }
+
+    def update(
+        self,
+        data: NodeDataType,
+        copy_data: bool = True,
+        emit_value_events: bool = False,
+    ) -> None:
+        """Update the internal state data.
+
+        When copy_data is False the node takes ownership of data instead of making
+        a deep copy of it. Only pass False for data that nothing else holds on to
+        and mutates, e.g. a message that was just received from the server.
+
+        When emit_value_events is True, value events are emitted for the values
+        that were added, changed or removed by the update (see `Controller.resync`).
+        """
+        if copy_data:
+            data = copy.deepcopy(data)
+        self.data = cast(
+            NodeDataType,
+            {
+                key: val
+                for key, val in data.items()
+                if key not in ("values", "endpoints")
+            },
+        )
+        # Nodes with the same device config share the instance and its data, nodes
+        # built without a client don't
+        device_config = self.data.get("deviceConfig", {})
+        if (cache := getattr(self.client, "device_config_cache", None)) is None:
+            self._device_config = DeviceConfig(device_config)
+        else:
+            self._device_config = cache.get(device_config)
+            if "deviceConfig" in self.data:
+                self.data["deviceConfig"] = self._device_config.data
         if (device_class := self.data.get("deviceClass")) is None:
             self._device_class = None
         else:
@@ -497,19 +676,25 @@ class Node(EventBase):
             object.__setattr__(self._statistics, "last_seen", self.last_seen)
             self._statistics.data["lastSeen"] = self.last_seen.isoformat()
 
-        self._update_values(self.data.pop("values"))
-        self._update_endpoints(self.data.pop("endpoints"))
+        value_events = self._update_values(data["values"], emit_value_events)
+        self._update_endpoints(data["endpoints"])
+
+        # Emit the value events once the node is fully updated
+        for event_data in value_events:
+            self._value_listeners.emit(event_data["value"].value_id, event_data)
+            self.emit(event_data["event"], event_data)
 
     def get_command_class_values(
         self, command_class: CommandClass, endpoint: int | None = None
     ) -> dict[str, ConfigurationValue | Value]:
         """Return all values for a given command class."""
-        return {
-            value_id: value
-            for value_id, value in self.values.items()
-            if value.command_class == command_class
-            and (endpoint is None or value.endpoint == endpoint)
-        }
+        if endpoint is None:
+            values = self._values_by_command_class.get(command_class)
+        else:
+            values = self._values_by_command_class_endpoint.get(
+                (command_class, endpoint)
+            )
+        return dict(values) if values else {}
 
     def get_configuration_values(self) -> dict[str, ConfigurationValue]:
         """Return all configuration values for a node."""
@@ -524,17 +709,26 @@ class Node(EventBase):
             _LOGGER.info("Unhandled node event: %s", event_type)
             return
 
-        NODE_EVENT_MODEL_MAP[event_type].from_dict(event.data)
-        self._handle_event_protocol(event)
+        validate_event(self.client, NODE_EVENT_MODEL_MAP[event_type], event.data)
         event.data["node"] = self
+        self._handle_event_protocol(event)
 
         self.emit(event_type, event.data)
 
+    def on_value(self, value_id: str | ValueID, callback: Callable) -> ListenerHandle:
+        """Register a callback for the value added/updated/removed events of a value.
+
+        Unlike listeners for the node events, the callback is only called for
+        events of the given value. Call the returned handle to unsubscribe.
+        """
+        return self._value_listeners.on(str(value_id), callback)
+
     async def async_send_command(
         self,
         cmd: str,
         require_schema: int | None = None,
         wait_for_result: bool | None = None,
+        command_timeout: float | None = None,
         **cmd_kwargs: Any,
     ) -> dict[str, Any] | None:
         """
@@ -542,18 +736,24 @@ class Node(EventBase):
 
         If wait_for_result is not None, it will take precedence, otherwise we will
         decide to wait or not based on the node status.
+
+        command_timeout overrides the default time to wait for the result, see
+        `Client.async_send_command`.
         """
-        kwargs = {}
+        kwargs: dict[str, Any] = {}
         message = {"command": f"node.{cmd}", "nodeId": self.node_id, **cmd_kwargs}
         if require_schema is not None:
             kwargs["require_schema"] = require_schema
+        wait_kwargs = kwargs
+        if command_timeout is not None:
+            wait_kwargs = {**kwargs, "timeout": command_timeout}
 
         if wait_for_result:
-            result = await self.client.async_send_command(message, **kwargs)
+            result = await self.client.async_send_command(message, **wait_kwargs)
             return result
         if wait_for_result is None and self.status not in (NodeStatus.ASLEEP,):
             result_task = asyncio.create_task(
-                self.client.async_send_command(message, **kwargs)
+                self.client.async_send_command(message, **wait_kwargs)
             )
             status_task = asyncio.create_task(self.status_event.wait())
             await asyncio.wait(
@@ -931,7 +1131,7 @@ class Node(EventBase):
         self, datetime_: datetime | None = None, wait_for_result: bool | None = None
     ) -> bool | None:
         """Send setDateAndTime command to Node."""
-        args = {}
+        args: dict[str, Any] = {}
         if datetime_:
             args["date"] = datetime_.isoformat()
         data = await self.async_send_command(
@@ -1136,8 +1336,15 @@ class Node(EventBase):
 
     def handle_ready(self, event: Event) -> None:
         """Process a node ready event."""
-        # the event contains a full dump of the node
-        self.update(event.data["nodeState"])
+        # When the device config changed, e.g. after a config update, don't share the
+        # old one with nodes that are added or become ready later
+        device_config = event.data["nodeState"].get("deviceConfig", {})
+        cache = getattr(self.client, "device_config_cache", None)
+        if cache is not None and device_config != self._device_config.data:
+            cache.discard(self._device_config)
+        # the event contains a full dump of the node which was freshly parsed from
+        # the server message, so there is no need to copy it
+        self.update(event.data["nodeState"], copy_data=False)
 
     def handle_value_added(self, event: Event) -> None:
         """Process a node value added event."""
@@ -1150,15 +1357,18 @@ class Node(EventBase):
         value = self.values.get(value_id)
         if value is None:
             value = self._init_value(evt_val_data)
-            self.values[value.value_id] = event.data["value"] = value
+            self._add_value(value.value_id, value)
+            event.data["value"] = value
         else:
-            value.receive_event(event)
+            self._update_value(value_id, value, evt_val_data)
             event.data["value"] = value
+        self._value_listeners.emit(value_id, event.data)
 
     def handle_value_removed(self, event: Event) -> None:
         """Process a node value removed event."""
         value_id = _get_value_id_str_from_dict(self, event.data["args"])
-        event.data["value"] = self.values.pop(value_id)
+        event.data["value"] = self._pop_value(value_id)
+        self._value_listeners.emit(value_id, event.data)
 
     def handle_value_notification(self, event: Event) -> None:
         """Process a node value notification event."""
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import IntEnum, StrEnum
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, NotRequired, Self, TypedDict, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple, NotRequired, Self, TypedDict, cast
+import weakref
 
 from ..const import (
     VALUE_UNKNOWN,
@@ -125,6 +126,60 @@ class ValueDataType(TypedDict, total=False):
     ccVersion: int  # required
 
 
+# Keys of ValueDataType that make up the ID of a value
+VALUE_ID_KEYS = frozenset(("commandClass", "endpoint", "property", "propertyKey"))
+
+
+class ValueID(NamedTuple):
+    """Represent the structured ID of a value.
+
+    str() of a ValueID returns the string value ID used as key in `Node.values`.
+    """
+
+    node_id: int
+    command_class: int
+    endpoint: int
+    property_: int | str
+    property_key: int | str | None = None
+
+    def __str__(self) -> str:
+        """Return the string value ID."""
+        return _format_value_id(
+            self.node_id,
+            self.command_class,
+            self.endpoint,
+            self.property_,
+            self.property_key,
+        )
+
+
+def _format_value_id(
+    node_id: int,
+    command_class: int,
+    endpoint: int,
+    property_: int | str,
+    property_key: int | str | None,
+) -> str:
+    """Return string ID of value."""
+    value_id = f"{node_id}-{command_class}-{endpoint}-{property_}"
+    # Property key is only included when it has a value
+    if property_key is not None:
+        value_id += f"-{property_key}"
+    return value_id
+
+
+def _get_value_id_from_dict(node: Node, val: ValueDataType) -> ValueID:
+    """Return structured ID of value from ValueDataType dict."""
+    return ValueID(
+        node.node_id,
+        val["commandClass"],
+        # If endpoint is not provided, assume root endpoint
+        val.get("endpoint") or 0,
+        val["property"],
+        val.get("propertyKey"),
+    )
+
+
 def _get_value_id_str_from_dict(node: Node, val: ValueDataType) -> str:
     """Return string ID of value from ValueDataType dict."""
     return get_value_id_str(
@@ -145,20 +200,82 @@ def get_value_id_str(
 ) -> str:
     """Return string ID of value."""
     # If endpoint is not provided, assume root endpoint
-    endpoint_ = endpoint or 0
-    value_id = f"{node.node_id}-{command_class}-{endpoint_}-{property_}"
-    # Property key is only included when it has a value
-    if property_key is not None:
-        value_id += f"-{property_key}"
-    return value_id
+    return _format_value_id(
+        node.node_id, command_class, endpoint or 0, property_, property_key
+    )
+
+
+class _SharedMetadata(dict):
+    """Metadata dict that the metadata pool can reference weakly."""
+
+    __slots__ = ("__weakref__",)
+
+
+class MetadataPool:
+    """Share metadata dicts with equal content between values.
+
+    Nodes of the same model have values with identical metadata, so values take
+    their initial metadata from the pool. Shared metadata is copied before it is
+    modified (see `ValueMetadata.update`). The pool only references the metadata
+    weakly, so metadata is dropped from the pool once no value uses it anymore,
+    e.g. after its node was removed or re-interviewed.
+    """
+
+    __slots__ = ("_pool",)
+
+    def __init__(self) -> None:
+        """Initialize the pool."""
+        # A cheap key narrows down the candidates, which are then compared in full
+        self._pool: dict[
+            tuple[Any, Any, int], list[weakref.ReferenceType[_SharedMetadata]]
+        ] = {}
+
+    def __len__(self) -> int:
+        """Return the number of metadata dicts in the pool."""
+        return sum(len(refs) for refs in self._pool.values())
+
+    def intern(self, data: MetaDataType) -> MetaDataType:
+        """Return the pooled metadata dict that is equal to data."""
+        key = (data.get("type"), data.get("label"), len(data))
+        if (refs := self._pool.get(key)) is None:
+            refs = self._pool[key] = []
+        for ref in refs:
+            if (shared := ref()) is not None and shared == data:
+                break
+        else:
+            shared = _SharedMetadata(data)
+            refs.append(weakref.ref(shared, partial(self._remove, key)))
+        return cast(MetaDataType, shared)
+
+    def _remove(
+        self, key: tuple[Any, Any, int], ref: weakref.ReferenceType[_SharedMetadata]
+    ) -> None:
+        """Remove a metadata dict that is no longer used from the pool."""
+        if (refs := self._pool.get(key)) is None or ref not in refs:
+            return
+        refs.remove(ref)
+        if not refs:
+            del self._pool[key]
+
+    def clear(self) -> None:
+        """Remove all metadata dicts from the pool."""
+        self._pool.clear()
 
 
 class ValueMetadata:
     """Represent metadata on a value instance."""
 
-    def __init__(self, data: MetaDataType) -> None:
-        """Initialize metadata."""
+    __slots__ = ("_allowed", "_shared", "data")
+
+    def __init__(self, data: MetaDataType, shared: bool = False) -> None:
+        """Initialize metadata.
+
+        When shared is True, data is shared with other values and is copied on the
+        first update.
+        """
         self.data = data
+        self._shared = shared
+        self._allowed: list[AllowedValue] | None = None
 
     @property
     def type(self) -> str:
@@ -235,7 +352,7 @@ class ValueMetadata:
         """Return secret."""
         return self.data.get("secret")
 
-    @cached_property
+    @property
     def allowed(self) -> list[AllowedValue] | None:
         """Return allowed values.
 
@@ -243,16 +360,18 @@ class ValueMetadata:
         use ``isinstance`` to discriminate. Cached because parsing allocates
         new dataclass instances; the cache is invalidated by `update()`.
         """
-        if (raw := self.data.get("allowed")) is None:
-            return None
-        return [
-            (
-                AllowedSingleValue.from_dict(cast("AllowedSingleValueDataType", entry))
-                if "value" in entry
-                else AllowedRangeValue.from_dict(entry)
-            )
-            for entry in raw
-        ]
+        if self._allowed is None and (raw := self.data.get("allowed")) is not None:
+            self._allowed = [
+                (
+                    AllowedSingleValue.from_dict(
+                        cast("AllowedSingleValueDataType", entry)
+                    )
+                    if "value" in entry
+                    else AllowedRangeValue.from_dict(entry)
+                )
+                for entry in raw
+            ]
+        return self._allowed
 
     @property
     def default(self) -> int | None:
@@ -293,22 +412,56 @@ class ValueMetadata:
 
     def update(self, data: MetaDataType) -> None:
         """Update data."""
-        self.data.update(data)
-        # Invalidate cached_property entries when their backing key changed.
+        if self._shared:
+            if all(
+                key in self.data and self.data[key] == value  # type: ignore[literal-required]
+                for key, value in data.items()
+            ):
+                # Keep sharing the metadata when the update doesn't change it
+                return
+            self.data = cast(MetaDataType, {**self.data, **data})
+            self._shared = False
+        else:
+            self.data.update(data)
+        # Invalidate the cached allowed values when their backing key changed.
         if "allowed" in data:
-            self.__dict__.pop("allowed", None)
+            self._allowed = None
 
 
 class Value:
     """Represent a Z-Wave JS value."""
 
-    def __init__(self, node: Node, data: ValueDataType) -> None:
-        """Initialize value."""
+    # Networks have tens of thousands of values, so they don't get a __dict__
+    __slots__ = ("_metadata", "_value", "_value_id", "_value_id_key", "data", "node")
+
+    def __init__(
+        self,
+        node: Node,
+        data: ValueDataType,
+        metadata_pool: MetadataPool | None = None,
+    ) -> None:
+        """Initialize value.
+
+        When a metadata pool is given, the metadata is shared with the values in the
+        pool that have equal metadata.
+        """
         self.node = node
         self.data: ValueDataType = {}
         self._value: Any = None
-        self._metadata = ValueMetadata({"type": "unknown"})
-        self.update(data)
+        # The value ID is cached and only computed again when its fields change
+        self._value_id_key: ValueID | None = None
+        self._value_id: str | None = None
+        if (
+            metadata_pool is None
+            or (metadata := data.get("metadata")) is None
+            or "type" not in metadata
+        ):
+            self._metadata = ValueMetadata({"type": "unknown"})
+            self.update(data)
+            return
+
+        self._metadata = ValueMetadata(metadata_pool.intern(metadata), shared=True)
+        self._update_data(data)
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -327,7 +480,16 @@ class Value:
     @property
     def value_id(self) -> str:
         """Return value ID."""
-        return _get_value_id_str_from_dict(self.node, self.data)
+        if self._value_id is None:
+            self._value_id = str(self.value_id_key)
+        return self._value_id
+
+    @property
+    def value_id_key(self) -> ValueID:
+        """Return the structured value ID."""
+        if self._value_id_key is None:
+            self._value_id_key = _get_value_id_from_dict(self.node, self.data)
+        return self._value_id_key
 
     @property
     def metadata(self) -> ValueMetadata:
@@ -393,16 +555,30 @@ class Value:
 
     def update(self, data: ValueDataType) -> None:
         """Update data."""
+        if "metadata" in data:
+            self._metadata.update(data["metadata"])
+        self._update_data(data)
+
+    def _update_data(self, data: ValueDataType) -> None:
+        """Update data, except for the metadata which is already up to date."""
         self.data.update(data)
         self.data.pop("prevValue", None)
         if "newValue" in self.data:
             self.data["value"] = self.data.pop("newValue")
 
         if "metadata" in data:
-            self._metadata.update(data["metadata"])
+            # Share the merged metadata instead of keeping a copy of the last update
+            self.data["metadata"] = self._metadata.data
 
         self._value = self.data.get("value")
 
+        # Invalidate the cached value ID when one of its fields has changed
+        if self._value_id_key is not None and not VALUE_ID_KEYS.isdisjoint(data):
+            value_id_key = _get_value_id_from_dict(self.node, self.data)
+            if value_id_key != self._value_id_key:
+                self._value_id_key = value_id_key
+                self._value_id = None
+
         # Handle buffer dict and json string in value.
         if self._value is not None and self.metadata.type == "buffer":
             self._value = parse_buffer(self._value)
@@ -418,6 +594,8 @@ class ValueNotification(Value):
     # format is the same as a Value message, subclassed for easier identifying and
     # future use
 
+    __slots__ = ()
+
 
 class ConfigurationValueFormat(IntEnum):
     """Enum of all known configuration value formats."""
@@ -472,6 +650,8 @@ def parse_supervision_result(
 class ConfigurationValue(Value):
     """Model for a Configuration Value."""
 
+    __slots__ = ()
+
     @property
     def configuration_value_type(self) -> ConfigurationValueType:
         """Return configuration value type."""
@@ -0,0 +1,120 @@
+"""Limit the number of commands that are in flight at the same time."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+
+from ..const import CommandPriority
+
+# Priority of commands that are not sent with an explicit priority
+COMMAND_PRIORITIES: dict[str, CommandPriority] = {
+    "node.set_value": CommandPriority.HIGH,
+    "endpoint.set_value": CommandPriority.HIGH,
+    "multicast_group.set_value": CommandPriority.HIGH,
+    "broadcast_node.set_value": CommandPriority.HIGH,
+    "node.poll_value": CommandPriority.LOW,
+    "node.refresh_values": CommandPriority.LOW,
+    "node.refresh_cc_values": CommandPriority.LOW,
+    "node.refresh_info": CommandPriority.LOW,
+}
+
+
+def get_command_priority(command: str) -> CommandPriority:
+    """Return the default priority of a command."""
+    return COMMAND_PRIORITIES.get(command, CommandPriority.NORMAL)
+
+
+@dataclass(frozen=True)
+class CommandQueueStats:
+    """Represent the state of the command window."""
+
+    # Maximum number of commands in flight, None when unlimited
+    limit: int | None
+    in_flight: int
+    # Number of commands waiting for a free slot per priority
+    queued: dict[CommandPriority, int]
+
+
+class CommandWindow:
+    """Bounded window of in-flight commands with priority lanes.
+
+    Commands wait for a free slot when the limit is reached. Free slots go to the
+    waiting command with the highest priority, in FIFO order per priority.
+
+    The last reserved_high slots of the window are reserved for HIGH priority
+    commands, so they don't wait behind a window full of background commands.
+    At least one slot is left for the other priorities.
+    """
+
+    def __init__(self, limit: int | None = None, reserved_high: int = 1) -> None:
+        """Initialize the window, a limit of None means unlimited."""
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        if reserved_high < 0:
+            raise ValueError("reserved_high must be at least 0")
+        self.limit = limit
+        # Maximum number of commands in flight for NORMAL and LOW priority commands
+        self.shared_limit = None if limit is None else max(1, limit - reserved_high)
+        self._in_flight = 0
+        self._lanes: dict[CommandPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in CommandPriority
+        }
+
+    @property
+    def stats(self) -> CommandQueueStats:
+        """Return the state of the command window."""
+        return CommandQueueStats(
+            self.limit,
+            self._in_flight,
+            {priority: len(lane) for priority, lane in self._lanes.items()},
+        )
+
+    def _has_slot(self, priority: CommandPriority) -> bool:
+        """Return whether a slot is free for a command of a priority."""
+        limit = self.limit if priority == CommandPriority.HIGH else self.shared_limit
+        return limit is None or self._in_flight < limit
+
+    def _can_start(self, priority: CommandPriority) -> bool:
+        """Return whether a command can start without waiting."""
+        if self.limit is None:
+            return True
+        return self._has_slot(priority) and not any(
+            lane
+            for lane_priority, lane in self._lanes.items()
+            if lane_priority <= priority
+        )
+
+    async def acquire(self, priority: CommandPriority = CommandPriority.NORMAL) -> None:
+        """Wait for a free slot for a command."""
+        if self._can_start(priority):
+            self._in_flight += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        lane = self._lanes[priority]
+        lane.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                if future in lane:
+                    lane.remove(future)
+            else:
+                # The slot was handed over right before the command was cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free the slot of a command and hand it over to the next command."""
+        self._in_flight -= 1
+        for priority, lane in self._lanes.items():
+            if not self._has_slot(priority):
+                continue
+            while lane:
+                future = lane.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    self._in_flight += 1
+                    return
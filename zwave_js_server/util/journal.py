@@ -0,0 +1,90 @@
+"""Journal of recorded messages that is written to a file while recording."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import os
+import queue
+import threading
+from typing import Any
+
+from .json import DEFAULT_CODEC
+
+# Size of the write buffer of the journal file
+JOURNAL_BUFFER_SIZE = 65536
+
+
+class MessageJournal:
+    """Append records of sent and received messages to a JSON Lines file.
+
+    Records have the format of the replay dump of `Client.end_recording_messages`
+    and are encoded when they are written, so memory use doesn't grow with the
+    length of a recording. The file is opened when the journal is created, so
+    create it in an executor when running in an event loop.
+
+    Records are encoded by the caller of write(), because the messages can
+    change after they are recorded, and the encoded lines are written to the file
+    by a writer thread, so write() and close() don't block on file I/O. Use
+    join() to wait until the file is complete after the journal is closed.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        dumps: Callable[[Any], str] = DEFAULT_CODEC.dumps,
+    ) -> None:
+        """Open the journal file for appending and start the writer thread."""
+        self.path = path
+        self.record_count = 0
+        self._dumps = dumps
+        self._closed = False
+        # pylint: disable-next=consider-using-with
+        self._file = open(path, "a", encoding="utf8", buffering=JOURNAL_BUFFER_SIZE)
+        # Encoded lines to write, None when the journal is closed
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_lines, name=f"MessageJournal {path}", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the journal is closed."""
+        return self._closed
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Encode a record and queue it to be appended to the journal."""
+        if self._closed:
+            raise ValueError("Journal is closed")
+        self._queue.put(f"{self._dumps(record)}\n")
+        self.record_count += 1
+
+    def close(self) -> None:
+        """Close the journal, the writer thread flushes and closes the file."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait until the queued records are written and the file is closed.
+
+        This blocks, so run it in an executor when running in an event loop.
+        """
+        self._writer.join(timeout)
+
+    def _write_lines(self) -> None:
+        """Write the queued lines to the file until the journal is closed."""
+        with self._file:
+            while (line := self._queue.get()) is not None:
+                self._file.write(line)
+
+
+def read_journal(
+    path: str | os.PathLike[str],
+    loads: Callable[[str | bytes], Any] = DEFAULT_CODEC.loads,
+) -> Iterator[dict[str, Any]]:
+    """Yield the records of a journal file."""
+    with open(path, encoding="utf8") as fp:
+        for line in fp:
+            if line.strip():
+                yield loads(line)
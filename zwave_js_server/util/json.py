@@ -0,0 +1,168 @@
+"""JSON codec used for the websocket transport.
+
+A fast third party JSON library (orjson or msgspec) is used when it is installed,
+otherwise we fall back to the standard library.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import importlib
+import json
+import time
+from types import ModuleType
+from typing import Any
+
+
+def _import_optional(name: str) -> ModuleType | None:
+    """Return an optional module or None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+orjson = _import_optional("orjson")
+msgspec = _import_optional("msgspec")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """Represent a JSON codec."""
+
+    name: str
+    # Decode a str or bytes JSON document, raises ValueError on invalid JSON
+    loads: Callable[[str | bytes], Any]
+    # Encode an object to a JSON str
+    dumps: Callable[[Any], str]
+
+
+STDLIB_CODEC = JSONCodec(
+    name="json",
+    loads=json.loads,
+    dumps=json.dumps,
+)
+
+
+def _get_orjson_codec() -> JSONCodec | None:
+    """Return an orjson based codec if orjson is installed."""
+    if orjson is None:
+        return None
+
+    def dumps(obj: Any) -> str:
+        """Encode an object to a JSON str."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    return JSONCodec(name="orjson", loads=orjson.loads, dumps=dumps)
+
+
+def _get_msgspec_codec() -> JSONCodec | None:
+    """Return a msgspec based codec if msgspec is installed."""
+    if msgspec is None:
+        return None
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: str | bytes) -> Any:
+        """Decode a JSON document."""
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as err:
+            raise ValueError(str(err)) from err
+
+    def dumps(obj: Any) -> str:
+        """Encode an object to a JSON str."""
+        return encoder.encode(obj).decode()
+
+    return JSONCodec(name="msgspec", loads=loads, dumps=dumps)
+
+
+def get_default_codec() -> JSONCodec:
+    """Return the fastest available JSON codec."""
+    return _get_orjson_codec() or _get_msgspec_codec() or STDLIB_CODEC
+
+
+DEFAULT_CODEC = get_default_codec()
+
+
+@dataclass(frozen=True)
+class ParseBucketStats:
+    """Represent parse timings for messages in a size bucket."""
+
+    # Messages in this bucket are at most max_size characters long
+    max_size: int
+    count: int
+    # Exponentially weighted moving average of the parse time in seconds
+    avg_parse_time: float
+
+
+class ParseOffloadPolicy:
+    """Decide whether a received message is parsed on or off the event loop.
+
+    Parse times are tracked per power of two size bucket. The threshold is moved
+    so that messages which are expected to block the event loop for longer than
+    max_inline_parse_time are offloaded to an executor, while smaller messages are
+    parsed inline where an executor round trip would cost more than the parse.
+    """
+
+    def __init__(
+        self,
+        initial_threshold: int,
+        max_inline_parse_time: float = 0.001,
+        smoothing: float = 0.2,
+    ) -> None:
+        """Initialize the policy."""
+        self.threshold = initial_threshold
+        self.max_inline_parse_time = max_inline_parse_time
+        self._smoothing = smoothing
+        self._counts: dict[int, int] = {}
+        self._avg_parse_times: dict[int, float] = {}
+
+    def should_offload(self, size: int) -> bool:
+        """Return whether a message of the given size should be offloaded."""
+        return size > self.threshold
+
+    def record(self, size: int, parse_time: float) -> None:
+        """Record the parse time of a message and move the threshold."""
+        bucket = size.bit_length()
+        if (avg := self._avg_parse_times.get(bucket)) is None:
+            avg = parse_time
+        else:
+            avg += self._smoothing * (parse_time - avg)
+        self._avg_parse_times[bucket] = avg
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+
+        bucket_min = (1 << bucket) >> 1
+        bucket_max = (1 << bucket) - 1
+        if avg > self.max_inline_parse_time:
+            # Parsing messages of this size blocks the loop for too long
+            if bucket_min <= self.threshold:
+                self.threshold = max(bucket_min - 1, 0)
+        elif bucket_max > self.threshold and not any(
+            smaller_avg > self.max_inline_parse_time
+            for smaller_bucket, smaller_avg in self._avg_parse_times.items()
+            if smaller_bucket < bucket
+        ):
+            # Parsing messages of this size is cheaper than an executor round trip
+            self.threshold = bucket_max
+
+    @property
+    def stats(self) -> list[ParseBucketStats]:
+        """Return the parse timings per size bucket."""
+        return [
+            ParseBucketStats(
+                max_size=(1 << bucket) - 1,
+                count=self._counts[bucket],
+                avg_parse_time=avg,
+            )
+            for bucket, avg in sorted(self._avg_parse_times.items())
+        ]
+
+
+def timed_parse(parse: Callable[[], Any]) -> tuple[Any, float]:
+    """Parse a message and return the result and the parse time in seconds."""
+    start = time.perf_counter()
+    data = parse()
+    return data, time.perf_counter() - start
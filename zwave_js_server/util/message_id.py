@@ -0,0 +1,36 @@
+"""Generate message IDs for commands sent to the server."""
+
+from __future__ import annotations
+
+from itertools import count
+import secrets
+import uuid
+
+
+class MessageIdGenerator:
+    """Generate message IDs from a counter, prefixed with a random nonce.
+
+    A new generator is used for every connection, so results of commands sent on a
+    previous connection can't be mistaken for results of new commands.
+    """
+
+    __slots__ = ("_counter", "_prefix")
+
+    def __init__(self) -> None:
+        """Initialize the generator."""
+        self._prefix = f"{secrets.token_hex(4)}-"
+        self._counter = count(1)
+
+    @property
+    def nonce(self) -> str:
+        """Return the nonce that prefixes the message IDs."""
+        return self._prefix[:-1]
+
+    def __call__(self) -> str:
+        """Return the next message ID."""
+        return f"{self._prefix}{next(self._counter)}"
+
+
+def uuid_message_id() -> str:
+    """Return a random UUID message ID."""
+    return uuid.uuid4().hex
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, cast
 
 from ..client import Client
-from ..const import CommandClass
+from ..const import CommandClass, Protocols
+from ..exceptions import NotFoundError, UnwriteableValue
 from ..model.node import Node, _get_value_id_dict_from_value_data
-from ..model.value import SetValueResult, ValueDataType
+from ..model.value import SetValueResult, Value, ValueDataType
 
 
 async def _async_send_command(
@@ -53,6 +56,173 @@ async def async_multicast_set_value(
     return SetValueResult(result["result"])
 
 
+class ValueWrite(NamedTuple):
+    """Represent a new value to set on a value of a node."""
+
+    node: Node
+    # A value may be specified as value ID or the value itself
+    value: Value | str
+    new_value: Any
+
+
+@dataclass
+class SetValueGroup:
+    """Represent writes that are sent with a single set_value command."""
+
+    value_data: ValueDataType
+    new_value: Any
+    nodes: list[Node] = field(default_factory=list)
+    # Indexes of the writes in the planned list of writes
+    write_indexes: list[int] = field(default_factory=list)
+
+
+def _get_value(write: ValueWrite) -> Value:
+    """Return the value of a write."""
+    if isinstance(write.value, Value):
+        value = write.value
+    elif (node_value := write.node.values.get(write.value)) is None:
+        raise NotFoundError(f"Value {write.value} not found on node {write.node}")
+    else:
+        value = node_value
+    if value.metadata.writeable is False:
+        raise UnwriteableValue
+    return value
+
+
+def plan_multicast_set_values(writes: list[ValueWrite]) -> list[SetValueGroup]:
+    """Group writes into as few set_value commands as possible.
+
+    Writes of the same new value to values with the same value ID fields (command
+    class, endpoint, property and property key) on different nodes are grouped
+    into one command. A node is only part of a group once, so writing the same
+    value twice to a node results in a second group.
+    """
+    groups: list[SetValueGroup] = []
+    group_nodes: list[set[Node]] = []
+    # The repr tells apart new values that are equal but differ in type, e.g. True
+    # and 1, and works for unhashable values
+    open_groups: dict[tuple[int, int, int | str, int | str | None, str], list[int]] = {}
+    for idx, write in enumerate(writes):
+        value = _get_value(write)
+        key = (
+            value.command_class,
+            value.endpoint or 0,
+            value.property_,
+            value.property_key,
+            repr(write.new_value),
+        )
+        group_idxs = open_groups.setdefault(key, [])
+        group_idx = next(
+            (
+                group_idx
+                for group_idx in group_idxs
+                if write.node not in group_nodes[group_idx]
+            ),
+            None,
+        )
+        if group_idx is None:
+            group_idx = len(groups)
+            group_idxs.append(group_idx)
+            groups.append(SetValueGroup(value.data, write.new_value))
+            group_nodes.append(set())
+        groups[group_idx].nodes.append(write.node)
+        groups[group_idx].write_indexes.append(idx)
+        group_nodes[group_idx].add(write.node)
+    return groups
+
+
+def _get_group_batches(groups: list[SetValueGroup]) -> list[list[SetValueGroup]]:
+    """Return the groups in batches that can be sent concurrently.
+
+    A group is sent in a later batch than the groups before it that write to the
+    same value of one of its nodes, so values end up with the last written value.
+    """
+    batches: list[list[SetValueGroup]] = []
+    # Index of the last batch that writes to a value of a node
+    value_batches: dict[tuple[Node, int, int, int | str, int | str | None], int] = {}
+    for group in groups:
+        value_data = group.value_data
+        targets = [
+            (
+                node,
+                value_data["commandClass"],
+                value_data.get("endpoint") or 0,
+                value_data["property"],
+                value_data.get("propertyKey"),
+            )
+            for node in group.nodes
+        ]
+        batch_idx = 1 + max(
+            (value_batches.get(target, -1) for target in targets), default=-1
+        )
+        if batch_idx == len(batches):
+            batches.append([])
+        batches[batch_idx].append(group)
+        for target in targets:
+            value_batches[target] = batch_idx
+    return batches
+
+
+def _is_broadcast_group(client: Client, nodes: list[Node]) -> bool:
+    """Return whether a group of nodes can be reached with a broadcast."""
+    if client.driver is None:
+        return False
+    controller = client.driver.controller
+    network_nodes = [
+        node
+        for node in controller.nodes.values()
+        if node.node_id != controller.own_node_id
+    ]
+    if set(nodes) != set(network_nodes):
+        return False
+    # Broadcasts without longRange don't reach Z-Wave Long Range nodes
+    return all(node.protocol != Protocols.ZWAVE_LONG_RANGE for node in nodes)
+
+
+async def async_multicast_set_values(
+    client: Client,
+    writes: list[ValueWrite],
+    options: dict | None = None,
+) -> list[SetValueResult | Exception | None]:
+    """Set new values on the values of many nodes with as few commands as possible.
+
+    The writes are grouped with `plan_multicast_set_values`. Groups of all nodes
+    of the network are sent as broadcast, other groups as multicast, and groups of
+    a single node as a regular set_value command of the node. The commands are sent
+    concurrently, except that writes to the same value of a node are sent one after
+    the other in the order of the writes. The result of the command of each write
+    is returned in the order of the writes. When a command fails, its exception is
+    returned as the result of its writes and the other commands are still sent.
+    """
+    groups = plan_multicast_set_values(writes)
+
+    async def async_send_group(group: SetValueGroup) -> SetValueResult | None:
+        """Send the set_value command of a group."""
+        if len(group.nodes) == 1:
+            return await group.nodes[0].async_set_value(
+                writes[group.write_indexes[0]].value, group.new_value, options
+            )
+        return await async_multicast_set_value(
+            client,
+            group.new_value,
+            group.value_data,
+            None if _is_broadcast_group(client, group.nodes) else group.nodes,
+            options,
+        )
+
+    results: list[SetValueResult | Exception | None] = [None] * len(writes)
+    for batch in _get_group_batches(groups):
+        batch_results = await asyncio.gather(
+            *(async_send_group(group) for group in batch), return_exceptions=True
+        )
+        for group, result in zip(batch, batch_results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            for idx in group.write_indexes:
+                results[idx] = result
+    return results
+
+
 async def async_multicast_get_endpoint_count(
     client: Client, nodes: list[Node] | None = None
 ) -> int:
@@ -0,0 +1,117 @@
+"""Log the websocket traffic of the client."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+# Logged messages are truncated to this number of characters
+DEFAULT_MAX_LENGTH = 2048
+# One in every this many events of the high rate event types is logged
+DEFAULT_EVENT_SAMPLE_RATE = 10
+
+# Event types that can be received many times per second on large networks
+SAMPLED_EVENTS = frozenset(
+    {
+        "metadata updated",
+        "statistics updated",
+        "value notification",
+        "value updated",
+    }
+)
+
+
+class WirePayload:
+    """Represent a message in the log, formatted when the log record is.
+
+    Received messages are logged as their raw text and sent messages are encoded
+    without pretty printing, truncated to max_length characters. The result is
+    cached for the other handlers of the log record.
+
+    Formatting runs in the thread that formats the log record. A plain
+    logging.handlers.QueueHandler doesn't move it off the event loop, because
+    QueueHandler.prepare() formats the record before queueing it. To format in
+    the QueueListener thread, use a QueueHandler subclass whose prepare() returns
+    the record unchanged. Sent messages are then encoded in that thread, so they
+    show changes made to the message dict after it was sent.
+    """
+
+    __slots__ = ("_dumps", "_max_length", "_message", "_text")
+
+    def __init__(
+        self,
+        message: str | dict[str, Any],
+        max_length: int,
+        dumps: Callable[[Any], str],
+    ) -> None:
+        """Initialize the payload."""
+        self._message = message
+        self._max_length = max_length
+        self._dumps = dumps
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        """Return the truncated message."""
+        if self._text is not None:
+            return self._text
+        message = self._message
+        text = message if isinstance(message, str) else self._dumps(message)
+        if len(text) > self._max_length:
+            text = (
+                f"{text[: self._max_length]}... "
+                f"({len(text) - self._max_length} more characters)"
+            )
+        self._text = text
+        return text
+
+
+class WireLogger:
+    """Log sent and received messages at debug level.
+
+    Only one in every event_sample_rate events of the types in SAMPLED_EVENTS is
+    logged, per event type.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        dumps: Callable[[Any], str],
+        max_length: int = DEFAULT_MAX_LENGTH,
+        event_sample_rate: int = DEFAULT_EVENT_SAMPLE_RATE,
+    ) -> None:
+        """Initialize the wire logger."""
+        if event_sample_rate < 1:
+            raise ValueError("event_sample_rate must be at least 1")
+        self.logger = logger
+        self.max_length = max_length
+        self.event_sample_rate = event_sample_rate
+        self._dumps = dumps
+        self._event_counts: dict[str, int] = {}
+
+    def log_received(self, text: str, data: dict[str, Any]) -> None:
+        """Log a received message from its raw text."""
+        if data.get("type") == "event":
+            event_type = data.get("event", {}).get("event")
+            if event_type in SAMPLED_EVENTS:
+                count = self._event_counts.get(event_type, 0)
+                self._event_counts[event_type] = count + 1
+                if count % self.event_sample_rate:
+                    return
+                self.logger.debug(
+                    "Received message (1 in %s %s events): %s",
+                    self.event_sample_rate,
+                    event_type,
+                    WirePayload(text, self.max_length, self._dumps),
+                )
+                return
+        self.logger.debug(
+            "Received message: %s", WirePayload(text, self.max_length, self._dumps)
+        )
+
+    def log_sent(self, message: dict[str, Any]) -> None:
+        """Log a sent message."""
+        self.logger.debug(
+            "Publishing message: %s",
+            WirePayload(message, self.max_length, self._dumps),
+        )